@@ -111,19 +111,29 @@ def configure_export_buttons():
     with col1:
         removed_eamails_from_cleverreach = []
         activated_emails_in_cleverreach = []
+        delta_sync = st.checkbox(
+            label="Only push changed receivers", key="cb_cleverreach_delta"
+        )
         if st.button(label="Sync to CleverReach", key="btn_cleverreach_sync"):
             removed_emails_from_cleverreach, activated_emails_in_cleverreach = (
-                st.session_state.client.sync_to_cleverreach()
+                st.session_state.client.sync_to_cleverreach(delta=delta_sync)
             )
             st.toast("Synced to CleverReach")
 
         if st.button(label="Riegenlisten", key="btn_riegenlisten"):
-            st.session_state.client.export_riegenlisten_excel()
-            st.toast("Exported riegenlisten")
+            results = st.session_state.client.export_riegenlisten_excel()
+            show_export_results("riegenlisten", results)
+            changed = [
+                result.name for result in results if result.success and result.changed
+            ]
+            if changed:
+                st.info(f"Changed riegenlisten: {', '.join(changed)}")
+            st.toast(f"Exported riegenlisten ({len(changed)} changed)")
 
         if st.button(label="Infoheft Liste", key="btn_infoheft"):
-            st.session_state.client.export_infoheft_list()
-            st.toast("Exported Infoheft Liste")
+            results = st.session_state.client.export_infoheft_list()
+            if show_export_results("Infoheft Liste", results):
+                st.toast("Exported Infoheft Liste")
 
     with col2:
         if st.button(label="Export CleverReach Data", key="btn_cleverreach_export"):
@@ -131,12 +141,16 @@ def configure_export_buttons():
             st.toast("Exported CleverReach Data")
 
         if st.button(label="No Mail", key="btn_no_mail"):
-            st.session_state.client.export_no_mail_excel()
-            st.toast("Exported No Mail")
+            results = st.session_state.client.export_no_mail_excel()
+            if show_export_results("No Mail", results):
+                st.toast("Exported No Mail")
 
         if st.button(label="Ehrenmitglieder No Mail", key="btn_ehrenmitglieder"):
-            st.session_state.client.export_ehrenmitglieder_no_mail_people_excel()
-            st.toast("Exported Ehrenmitglieder No Mail")
+            results = (
+                st.session_state.client.export_ehrenmitglieder_no_mail_people_excel()
+            )
+            if show_export_results("Ehrenmitglieder No Mail", results):
+                st.toast("Exported Ehrenmitglieder No Mail")
 
     # Year input and button alignment
     st.markdown("Export GV Lists by Year:")
@@ -158,8 +172,9 @@ def configure_export_buttons():
         export_clicked = st.button(label="Export", key="export_gv_button")
         if export_clicked:
             if gv_year.isdigit() and len(gv_year) == 4:
-                st.session_state.client.export_gv_lists(int(gv_year))
-                st.toast(f"Exported GV lists for year {gv_year}.")
+                results = st.session_state.client.export_gv_lists(int(gv_year))
+                if show_export_results("GV lists", results):
+                    st.toast(f"Exported GV lists for year {gv_year}.")
             else:
                 st.error("Please enter a valid 4-digit year.")
     if removed_eamails_from_cleverreach:
@@ -179,6 +194,14 @@ def configure_export_buttons():
     st.markdown('<div class="section-spacing"></div>', unsafe_allow_html=True)
 
 
+def show_export_results(label: str, results: list) -> bool:
+    """Show an error for failed exports, return whether all succeeded."""
+    failed = [result for result in results if not result.success]
+    for result in failed:
+        st.error(f"Failed to export {label} ({result.name}): {result.error}")
+    return len(failed) == 0
+
+
 def reset_client():
     if isinstance(st.session_state.client, STVAdminExportClient):
         del st.session_state.client
@@ -201,6 +224,7 @@ def configure_stop():
     )
 
     if st.button("Shut down"):
+        st.session_state.client.clear_snapshot_cache()
         os.kill(os.getpid(), signal.SIGTERM)
 
 
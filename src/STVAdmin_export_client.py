@@ -2,15 +2,12 @@ import os
 import copy
 import logging
 import pandas as pd
-import numpy as np
 from typing import Optional
 from pathlib import Path
 
 from src import (
     ADULT_CAT,
     EHRENMITGLIEDER_CAT,
-    NOT_ACTIVE_ERW_CAT,
-    MALE,
     JUGEND_CAT,
     is_jugend_riege,
 )
@@ -18,11 +15,30 @@ from src.utils.cleverreach_client import (
     ALLE_MITGLIEDER_GROUP_ID,
     AUSGETRETEN_FILTER_ID,
     CleverreachClient,
+    UpsertResult,
 )
 from src.utils.dynamics_client import DynamicsClient
 
-from src.utils.databases import MailBasedDatabase, Database, HouseBasedDatabase
+from src.utils.databases import (
+    MailBasedDatabase,
+    Database,
+    ColumnarDatabase,
+    Person,
+    HouseBasedDatabase,
+)
 from src.utils.cleverreach_database import CleverreachDatabase
+from src.utils.snapshot_cache import SnapshotCache
+from src.utils.export_pool import (
+    ExportJob,
+    ExportResult,
+    build_and_write_df,
+    run_export_jobs,
+)
+from src.utils.writers import get_writer, write_df
+from src.utils.riegen_matrix import get_overlap_matrix
+from src.utils.member_statistics import MemberStatistics, compute_statistics
+from src.utils.gv_cohorts import GVCohorts
+from src.utils.export_manifest import ExportManifest
 from src.utils.adress_databases import (
     AdressDatabase,
     RiegenAdressDatabase,
@@ -31,11 +47,13 @@ from src.utils.adress_databases import (
 from src.config.paths import WORKING_DIR_PATH
 
 OUTPUT_FOLDER = "OUT"
+CACHE_FOLDER = ".cache"
 FILENAME_ADDITIONAL_PEOPLE = "Newsletter_Zusaetzlich.xlsx"
 FILENAME_HOUSEMATES = "TVW_Mitglieder_Housemates.xlsx"
 FILENAME_BACKUP_LIST = "TVW_Mitglieder_Backup_10_23.xlsx"
 FILENAME_REMOVE_LIST = "Newsletter_abmeldungen.xlsx"
 FILENAME_JUBILARE = "TVW_List_OUT_Jubilare_{year}.xlsx"
+JUBILARE = [25, 30, 40, 50, 60, 70, 80]
 
 FILENAME_NEUMITGLIEDER = "TVW_List_OUT_neumitglieder.xlsx"
 FILENAME_JUGENDUEBERTRITT = "TVW_List_OUT_jugenduebertritte.xlsx"
@@ -43,6 +61,32 @@ FILENAME_LOST_EMAIL = "TVW_List_OUT_lost_email.xlsx"
 FILENAME_INFOHEFT = "TVW_List_OUT_Infoheft.xlsx"
 
 
+def _get_riegenliste_df(members: list, coaches: list) -> pd.DataFrame:
+    member_db = Database()
+    member_db.add_people(members)
+    member_ad_db = AdressDatabase(input_db=member_db)
+
+    coach_db = Database()
+    coach_db.add_people(coaches)
+    coach_ad_db = AdressDatabase(input_db=coach_db)
+
+    riegen_ad_db = RiegenAdressDatabase(
+        member_ad_db=member_ad_db, coach_ad_db=coach_ad_db
+    )
+    return riegen_ad_db.df
+
+
+def _get_db_grouped_by_category(people: list, categories: list[str]) -> Database:
+    # the lists are read category by category, so keep them grouped in the
+    # order of categories and in database order within a category
+    rank = {category: idx for idx, category in enumerate(categories)}
+    db = Database()
+    db.add_people(
+        sorted(people, key=lambda person: rank.get(person.category, len(rank)))
+    )
+    return db
+
+
 class STVAdminExportClient:
     tag_base_member = "BaseMember"
     tag_non_member_newsletter_recipient = "NonMemberNewsletterRecipient"
@@ -59,11 +103,21 @@ class STVAdminExportClient:
         self._userlist_filename: Optional[Path] = None
         self._riegenlist_filename: Optional[Path] = None
         self._main_db = None
+        self._mb_db = None
+        self._mb_db_version = None
+        self._cr_db = None
+        self._cr_db_key = None
+        self._statistics = None
+        self._statistics_key = None
+        self._gv_cohorts = None
+        self._gv_cohorts_version = None
         self._keep_files = keep_files
         self._debugging_mode = debugging_mode
+        self._snapshot_cache = SnapshotCache(os.path.join(self.path, CACHE_FOLDER))
         self.cr_client = CleverreachClient()
 
     def __del__(self):
+        self.cr_client.close()
         if self._keep_files:
             return
         if self._userlist_filename:
@@ -71,6 +125,10 @@ class STVAdminExportClient:
         if self._riegenlist_filename:
             os.remove(os.path.join(self.path, self._riegenlist_filename))
 
+    def clear_snapshot_cache(self):
+        """Delete the cached main_db, which holds the full member data."""
+        self._snapshot_cache.clear()
+
     @property
     def userlist_filename(self):
         if self._userlist_filename is None:
@@ -86,52 +144,102 @@ class STVAdminExportClient:
     @property
     def main_db(self):
         if self._main_db is None:
-            self._main_db = self._load_main_db()
-            self._detect_missing_emails_from_backup()
-            self._remove_mail_from_removelist()
-            self._add_additional_newsletter_recipients()
+            self._main_db, people_lost_email = self._snapshot_cache.get_or_create(
+                "main_db", self._get_main_db_input_files(), self._build_main_db
+            )
+            self._report_lost_emails(people_lost_email)
         return self._main_db
 
-    def export_riegenlisten_excel(self):
+    def _build_main_db(self) -> tuple[Database, list[Person]]:
+        self._main_db = self._load_main_db()
+        people_lost_email = self._detect_missing_emails_from_backup()
+        self._remove_mail_from_removelist()
+        self._add_additional_newsletter_recipients()
+        return self._main_db, people_lost_email
+
+    def _get_main_db_input_files(self) -> list[Optional[str]]:
+        return [
+            os.path.join(self.path, self.userlist_filename),
+            os.path.join(self.path, self.riegenlist_filename),
+            os.path.join(self.path, FILENAME_BACKUP_LIST)
+            if FILENAME_BACKUP_LIST
+            else None,
+            os.path.join(self.path, FILENAME_REMOVE_LIST)
+            if FILENAME_REMOVE_LIST
+            else None,
+            os.path.join(self.path, FILENAME_ADDITIONAL_PEOPLE),
+        ]
+
+    def export_riegenlisten_excel(
+        self,
+        max_workers: Optional[int] = None,
+        executor: str = "thread",
+        writer: str = "xlsx",
+    ) -> list[ExportResult]:
         riegen = self._get_riegen()
-        path = Path(os.path.join(self.path, OUTPUT_FOLDER, "Riegenlisten"))
-        path.mkdir(parents=True, exist_ok=True)
-
-        for riege in riegen.keys():
-            member_db = Database()
-            member_db.add_people(riegen[riege]["members"])
-            member_ad_db = AdressDatabase(input_db=member_db)
-
-            coach_db = Database()
-            coach_db.add_people(riegen[riege]["coaches"])
-            coach_ad_db = AdressDatabase(input_db=coach_db)
-            today = pd.Timestamp.now()
-            filename = f"{riege}_export_{today.strftime('%d.%m.%Y')}.xlsx"
-
-            riegen_ad_db = RiegenAdressDatabase(
-                member_ad_db=member_ad_db, coach_ad_db=coach_ad_db
+        today = pd.Timestamp.now()
+        folder = os.path.join(self.path, OUTPUT_FOLDER)
+        manifest = ExportManifest(folder)
+        jobs = []
+        for riege, value in riegen.items():
+            filename = get_writer(writer).get_filename(
+                os.path.join(
+                    folder,
+                    "Riegenlisten",
+                    f"{riege}_export_{today.strftime('%d.%m.%Y')}.xlsx",
+                )
+            )
+            jobs.append(
+                ExportJob(
+                    name=riege,
+                    filename=filename,
+                    function=build_and_write_df,
+                    args=(
+                        riege,
+                        filename,
+                        _get_riegenliste_df,
+                        (value["members"], value["coaches"]),
+                        writer,
+                        False,
+                        manifest,
+                    ),
+                )
             )
-            riegen_ad_db.to_excel(os.path.join(path, filename))
+        return run_export_jobs(
+            jobs, max_workers=max_workers, executor=executor, manifest=manifest
+        )
 
     def export_cleverreach_csv(self, output_filename: str = "TVW_List_OUT.csv"):
-        mb_db = MailBasedDatabase(input_db=self.main_db)
-        cr_db = CleverreachDatabase(input_mb_database=mb_db)
+        cr_db = self._get_cleverreach_database()
         cr_db.to_csv(os.path.join(self.path, OUTPUT_FOLDER, output_filename))
 
-    def sync_to_cleverreach(self) -> list[str]:
-        self.push_data_to_cleverreach()
+    def sync_to_cleverreach(self, delta: bool = False) -> list[str]:
+        self.push_data_to_cleverreach(delta=delta)
         self.update_ausgetreten_filter_in_cleverreach(pd.Timestamp.today().floor("D"))
         removed_emails = self.remove_receivers_from_ausgetreten_filter_in_cleverreach()
         activated_emails = self.activate_inactive_receivers_in_cleverreach()
         return removed_emails, activated_emails
 
-    def push_data_to_cleverreach(self):
-        mb_db = MailBasedDatabase(input_db=self.main_db)
-        cr_db = CleverreachDatabase(input_mb_database=mb_db)
-        receivers = cr_db.to_receivers()
-        self.cr_client.update_receivers_for_group(
+    def push_data_to_cleverreach(self, delta: bool = False) -> UpsertResult:
+        cr_db = self._get_cleverreach_database()
+        if delta:
+            receivers = cr_db.to_receivers_delta(
+                self.cr_client.get_receivers_for_group_complete(
+                    group_id=ALLE_MITGLIEDER_GROUP_ID
+                )
+            )
+        else:
+            receivers = cr_db.to_receivers()
+        result = self.cr_client.update_receivers_for_group(
             group_id=ALLE_MITGLIEDER_GROUP_ID, receivers=receivers
         )
+        # receivers without a fresh "updated" date would end up in the
+        # ausgetreten filter and be deleted, so stop the sync here
+        if not result.success:
+            raise Exception(
+                f"Failed to update {len(result.failed)} receivers in CleverReach: {result.failed_emails}"
+            )
+        return result
 
     def update_ausgetreten_filter_in_cleverreach(self, date: pd.Timestamp):
         filter_template = {
@@ -179,230 +287,191 @@ class STVAdminExportClient:
             group_id=ALLE_MITGLIEDER_GROUP_ID, type="inactive"
         )
         ids_to_activate = [receiver["id"] for receiver in r]
-        emails_activated = [receiver["email"] for receiver in r]
         if len(ids_to_activate) == 0:
             logging.info("No inactive receivers to activate")
             return []
-        for receiver_id in ids_to_activate:
-            self.cr_client.activate_receiver(
-                group_id=ALLE_MITGLIEDER_GROUP_ID, receiver_id=receiver_id
-            )
-        return emails_activated
+        results = self.cr_client.activate_receivers(
+            group_id=ALLE_MITGLIEDER_GROUP_ID, receiver_ids=ids_to_activate
+        )
+        return [
+            receiver["email"] for receiver, result in zip(r, results) if result.success
+        ]
 
-    def export_no_mail_excel(self, output_filename: str = "TVW_List_OUT_nomail.xlsx"):
-        ad_db = self._convert_no_mail_people_with_property_to_ad_db()
-        ad_db.to_excel(os.path.join(self.path, OUTPUT_FOLDER, output_filename))
+    def export_no_mail_excel(
+        self, output_filename: str = "TVW_List_OUT_nomail.xlsx", writer: str = "xlsx"
+    ) -> list[ExportResult]:
+        ad_db = AdressDatabase(input_db=self.main_db.query().where(email=None))
+        return self._export_dfs(
+            [(output_filename, output_filename, ad_db.df)], writer=writer
+        )
 
     def export_ehrenmitglieder_no_mail_people_excel(
-        self, output_filename: str = "TVW_List_OUT_ehrenmitglieder_nomail.xlsx"
-    ):
-        ad_db = self._convert_no_mail_people_with_property_to_ad_db(
-            values=EHRENMITGLIEDER_CAT, property="category"
+        self,
+        output_filename: str = "TVW_List_OUT_ehrenmitglieder_nomail.xlsx",
+        writer: str = "xlsx",
+    ) -> list[ExportResult]:
+        query = self.main_db.query().where(email=None, category__in=EHRENMITGLIEDER_CAT)
+        ad_db = AdressDatabase(
+            input_db=_get_db_grouped_by_category(query.people, EHRENMITGLIEDER_CAT)
+        )
+        return self._export_dfs(
+            [(output_filename, output_filename, ad_db.df)], writer=writer
         )
-        ad_db.to_excel(os.path.join(self.path, OUTPUT_FOLDER, output_filename))
 
     def export_adult_people_joined_in_timerange_excel(
         self,
         output_filename: str,
         begin: Optional[pd.Timestamp] = None,
         end: Optional[pd.Timestamp] = None,
-    ):
-        adult_people = []
-        for cat in ADULT_CAT:
-            adult_people += self.main_db.lookup_by_property("category", cat)
-        current_db = Database()
-        current_db.add_people(adult_people)
-
-        if begin:
-            joined_after_date_people = current_db.lookup_by_property(
-                property="date_added", search_input=begin, comparator=np.greater_equal
-            )
-            current_db = Database()
-            current_db.add_people(joined_after_date_people)
-        if end:
-            joined_before_date_people = current_db.lookup_by_property(
-                property="date_added", search_input=end, comparator=np.less
-            )
-            current_db = Database()
-            current_db.add_people(joined_before_date_people)
-
-        ad_db = AdressDatabase(input_db=current_db)
-        ad_db.to_excel(os.path.join(self.path, OUTPUT_FOLDER, output_filename))
-
-    def export_jugend_born_in_year(self, year: int, output_filename: str):
-        jugend_people = []
-        for cat in JUGEND_CAT:
-            jugend_people += self.main_db.lookup_by_property("category", cat)
-        jugend_people_db = Database()
-        jugend_people_db.add_people(jugend_people)
-
-        after_date = pd.Timestamp(year=year, month=1, day=1)
-        born_after_date_people = jugend_people_db.lookup_by_property(
-            "birthday", after_date, comparator=np.greater_equal
+        writer: str = "xlsx",
+    ) -> list[ExportResult]:
+        query = self.main_db.query().where(category__in=ADULT_CAT)
+        if begin is not None or end is not None:
+            query = query.where(date_added__between=(begin, end))
+        ad_db = AdressDatabase(
+            input_db=_get_db_grouped_by_category(query.people, ADULT_CAT)
         )
-        born_after_date_db = Database()
-        born_after_date_db.add_people(born_after_date_people)
-
-        before_date = pd.Timestamp(year=year + 1, month=1, day=1)
-        born_before_date_people = born_after_date_db.lookup_by_property(
-            "birthday", before_date, comparator=np.less
+        return self._export_dfs(
+            [(output_filename, output_filename, ad_db.df)], writer=writer
         )
-        born_before_date_db = Database()
-        born_before_date_db.add_people(born_before_date_people)
-
-        ad_db = AdressDatabase(input_db=born_before_date_db)
-        ad_db.to_excel(os.path.join(self.path, OUTPUT_FOLDER, output_filename))
 
-    def export_gv_lists(self, gv_year: int):
-        last_gv = pd.Timestamp(year=gv_year - 1, month=1, day=1)
-        year_for_uebertritt = gv_year - 17
-        self.export_adult_people_joined_in_timerange_excel(
-            output_filename=FILENAME_NEUMITGLIEDER, begin=last_gv
+    def export_jugend_born_in_year(
+        self, year: int, output_filename: str, writer: str = "xlsx"
+    ) -> list[ExportResult]:
+        query = self.main_db.query().where(
+            category__in=JUGEND_CAT,
+            birthday__between=(
+                pd.Timestamp(year=year, month=1, day=1),
+                pd.Timestamp(year=year + 1, month=1, day=1),
+            ),
+        )
+        ad_db = AdressDatabase(
+            input_db=_get_db_grouped_by_category(query.people, JUGEND_CAT)
+        )
+        return self._export_dfs(
+            [(output_filename, output_filename, ad_db.df)], writer=writer
         )
-        jubilare = [25, 30, 40, 50, 60, 70, 80]
-        for jubilar in jubilare:
+
+    def export_gv_lists(self, gv_year: int, writer: str = "xlsx") -> list[ExportResult]:
+        cohorts = self._get_gv_cohorts()
+        gv_lists = {
+            FILENAME_NEUMITGLIEDER: cohorts.adults_joined(begin=gv_year - 1),
+        }
+        for jubilar in JUBILARE:
             year = gv_year - jubilar
-            self.export_adult_people_joined_in_timerange_excel(
-                output_filename=FILENAME_JUBILARE.format(year=jubilar),
-                begin=pd.Timestamp(year=year, month=1, day=1),
-                end=pd.Timestamp(year=year + 1, month=1, day=1),
+            gv_lists[FILENAME_JUBILARE.format(year=jubilar)] = cohorts.adults_joined(
+                begin=year, end=year + 1
             )
-        self.export_jugend_born_in_year(
-            year=year_for_uebertritt, output_filename=FILENAME_JUGENDUEBERTRITT
+        year_for_uebertritt = gv_year - 17
+        gv_lists[FILENAME_JUGENDUEBERTRITT] = cohorts.youth_born(
+            begin=year_for_uebertritt, end=year_for_uebertritt + 1
         )
 
-    def export_infoheft_list(self):
-        printed_infoheft_people = self.main_db.lookup_by_property(
-            "printed_magazine", True
+        exports = []
+        for output_filename, people in gv_lists.items():
+            gv_db = Database()
+            gv_db.add_people(people)
+            ad_db = AdressDatabase(input_db=gv_db)
+            exports.append((output_filename, output_filename, ad_db.df))
+        return self._export_dfs(exports, writer=writer)
+
+    def export_infoheft_list(self, writer: str = "xlsx") -> list[ExportResult]:
+        hb_db = HouseBasedDatabase(
+            input_db=self.main_db.query().where(printed_magazine=True)
         )
-        printed_infoheft_db = Database()
-        printed_infoheft_db.add_people(printed_infoheft_people)
-        hb_db = HouseBasedDatabase(input_db=printed_infoheft_db)
         hb_db.combine_housemates(
             housemates_file=os.path.join(self.path, FILENAME_HOUSEMATES)
         )
         hb_ad_db = HouseBasedAdressDatabase(hb_db=hb_db)
-        hb_ad_db.to_excel(os.path.join(self.path, OUTPUT_FOLDER, FILENAME_INFOHEFT))
+        return self._export_dfs(
+            [(FILENAME_INFOHEFT, FILENAME_INFOHEFT, hb_ad_db.df)], writer=writer
+        )
 
     def get_statistics(self) -> str:
-        # ToDo: refactor to make code easier to read / maintain
-        max_age = 0
-        min_age = np.inf
-        num_of_men = 0
-        num_of_women = 0
-        num_of_girls = 0
-        num_of_boys = 0
-        num_of_kids = 0
-        num_of_erw = 0
-        num_of_active_men = 0
-        num_of_passive_or_nturnend_men = 0
-        num_of_active_women = 0
-        num_of_passive_or_nturnend_women = 0
-        num_total = 0
-        for person in self.main_db.people:
-            if self.tag_base_member not in person.tags:
-                continue
-            num_total += 1
-            if person.age < min_age:
-                min_age = person.age
-            if person.age > max_age:
-                max_age = person.age
-            if person.category not in ADULT_CAT:
-                num_of_kids += 1
-                if person.gender == MALE:
-                    num_of_boys += 1
-                else:
-                    num_of_girls += 1
-            else:
-                num_of_erw += 1
-                if person.gender == MALE:
-                    num_of_men += 1
-                    if person.category in NOT_ACTIVE_ERW_CAT:
-                        num_of_passive_or_nturnend_men += 1
-                    else:
-                        num_of_active_men += 1
-                else:
-                    num_of_women += 1
-                    if person.category in NOT_ACTIVE_ERW_CAT:
-                        num_of_passive_or_nturnend_women += 1
-                    else:
-                        num_of_active_women += 1
-
-        res = f"""
-
-
-            **Total Number of Members:** {str(num_total)}  
-
-            **Number of Adults:** {str(num_of_erw)}  
-            Men: {str(num_of_men)}  
-            active Men: {str(num_of_active_men)}  
-            passive or non-active Men: {str(num_of_passive_or_nturnend_men)}  
-            Women: {str(num_of_women)}  
-            active Women: {str(num_of_active_women)}  
-            passive or non-active Women: {str(num_of_passive_or_nturnend_women)}  
-                
-            **Number of Children:** {str(num_of_kids)}  
-                Boys: {str(num_of_boys)}  
-                Girls: {str(num_of_girls)}  
-
-
-            **Oldest Member:** {str(max_age)} years old  
-            **Youngest Member:** {str(min_age)} years old
-            """
-        return res
+        return self.get_member_statistics().to_markdown()
+
+    def get_member_statistics(self) -> MemberStatistics:
+        # ages change with the date, so a new day needs a recomputation
+        key = (self.main_db.version, pd.Timestamp.today().floor("D"))
+        if self._statistics is None or self._statistics_key != key:
+            self._statistics = compute_statistics(
+                self.main_db.table, base_member_tag=self.tag_base_member
+            )
+            self._statistics_key = key
+        return self._statistics
 
     def create_riegenmatrix(
-        self, output_filename: Optional[str] = "TVW_riegenmatrix.xlsx"
-    ):
-        riegen = self._get_riegen()
-        riegen = {
-            key: value for key, value in riegen.items() if not is_jugend_riege(key)
-        }
-        matrix = pd.DataFrame(columns=riegen.keys(), index=riegen.keys())
-
-        for riege, value in riegen.items():
-            members = value["members"]
-            coaches = value["coaches"]
-            combined = members + coaches
-
-            for comparison_riege, comparison_value in riegen.items():
-                comparison_members = comparison_value["members"]
-                comparison_coaches = comparison_value["coaches"]
-                comparison_combined = comparison_members + comparison_coaches
-
-                people_in_both = [
-                    person for person in combined if person in comparison_combined
-                ]
-
-                matrix.loc[riege, comparison_riege] = len(people_in_both)
-        matrix.to_excel(os.path.join(self.path, OUTPUT_FOLDER, output_filename))
+        self,
+        output_filename: Optional[str] = "TVW_riegenmatrix.xlsx",
+        writer: str = "xlsx",
+        role: str = "all",
+        comparison_role: Optional[str] = None,
+        jaccard: bool = False,
+    ) -> list[ExportResult]:
+        riegen = [riege for riege in self._get_riegen() if not is_jugend_riege(riege)]
+        matrix = get_overlap_matrix(
+            self.main_db.people,
+            riegen,
+            role=role,
+            comparison_role=comparison_role,
+            jaccard=jaccard,
+        )
+        return self._export_dfs(
+            [(output_filename, output_filename, matrix)], writer=writer, index=True
+        )
 
-    def _convert_no_mail_people_with_property_to_ad_db(
+    def _export_dfs(
         self,
-        values: Optional[list[str]] = None,
-        property: Optional[str] = None,
-        comparator=None,
-    ) -> AdressDatabase:
-        mb_db = MailBasedDatabase(input_db=self.main_db)
-        no_mail_families = mb_db.lookup_by_property("email", None)
-        if len(no_mail_families) != 1:
-            raise ValueError("To many no mail families!")
-        no_mail_family = no_mail_families[0]
-        no_mail_db = Database()
-        no_mail_db.add_people(no_mail_family.people)
-
-        if values is None:
-            wanted_people_db = no_mail_db
-        else:
-            wanted_people = []
-            for value in values:
-                wanted_people += no_mail_db.lookup_by_property(
-                    property=property, search_input=value, comparator=comparator
+        exports: list[tuple[str, str, pd.DataFrame]],
+        writer: str = "xlsx",
+        index: bool = False,
+        max_workers: Optional[int] = None,
+        executor: str = "thread",
+    ) -> list[ExportResult]:
+        """Write the (name, output_filename, df) exports that changed."""
+        folder = os.path.join(self.path, OUTPUT_FOLDER)
+        jobs = []
+        for name, output_filename, df in exports:
+            filename = get_writer(writer).get_filename(
+                os.path.join(folder, output_filename)
+            )
+            jobs.append(
+                ExportJob(
+                    name=name,
+                    filename=filename,
+                    function=write_df,
+                    args=(df, filename, writer, index),
+                    content_hash=ExportManifest.get_content_hash(df, writer, index),
                 )
-            wanted_people_db = Database()
-            wanted_people_db.add_people(wanted_people)
-        ad_db = AdressDatabase(input_db=wanted_people_db)
-        return ad_db
+            )
+        return run_export_jobs(
+            jobs,
+            max_workers=max_workers,
+            executor=executor,
+            manifest=ExportManifest(folder),
+        )
+
+    def _get_mail_based_database(self) -> MailBasedDatabase:
+        if self._mb_db is None or self._mb_db_version != self.main_db.version:
+            self._mb_db = MailBasedDatabase(input_db=self.main_db)
+            self._mb_db_version = self.main_db.version
+        return self._mb_db
+
+    def _get_cleverreach_database(self) -> CleverreachDatabase:
+        # the "updated" column holds today's date, so a new day needs a rebuild
+        key = (self.main_db.version, pd.Timestamp.today().floor("D"))
+        if self._cr_db is None or self._cr_db_key != key:
+            self._cr_db = CleverreachDatabase(
+                input_mb_database=self._get_mail_based_database()
+            )
+            self._cr_db_key = key
+        return self._cr_db
+
+    def _get_gv_cohorts(self) -> GVCohorts:
+        if self._gv_cohorts is None or self._gv_cohorts_version != self.main_db.version:
+            self._gv_cohorts = GVCohorts(self.main_db.table)
+            self._gv_cohorts_version = self.main_db.version
+        return self._gv_cohorts
 
     def _get_riegen(self) -> dict:
         riegen = {}
@@ -428,7 +497,7 @@ class STVAdminExportClient:
         return filename
 
     def _load_main_db(self):
-        main_db = Database(os.path.join(self.path, self.userlist_filename))
+        main_db = ColumnarDatabase(os.path.join(self.path, self.userlist_filename))
         main_db.load_riegen(os.path.join(self.path, self.riegenlist_filename))
         main_db.add_tag_to_all(self.tag_base_member)
         return main_db
@@ -447,30 +516,37 @@ class STVAdminExportClient:
             os.path.join(self.path, FILENAME_REMOVE_LIST)
         )
         emails_to_remove = [
-            person.email for person in remove_from_mailinglist_db.people
+            person.email
+            for person in remove_from_mailinglist_db.people
+            if person.email is not None
         ]
         logging.info(f"Removing the following emails: {str(emails_to_remove)}")
-        for email in emails_to_remove:
-            self.main_db.remove_value_for_property_from_people(
-                value=email, property="email"
-            )
+        people_changed = self.main_db.remove_values_for_property_from_people(
+            values=set(emails_to_remove), property="email"
+        )
+        logging.info(f"Removed email from {len(people_changed)} people")
 
-    def _detect_missing_emails_from_backup(self):
+    def _detect_missing_emails_from_backup(self) -> list[Person]:
+        """Return copies of the people that lost an email, with that email set."""
         if not FILENAME_BACKUP_LIST:
             logging.warning("No backup list provided!")
-            return
+            return []
         backup_db = Database(os.path.join(self.path, FILENAME_BACKUP_LIST))
-        copied_db = copy.deepcopy(self.main_db)
-        people_no_mail = [person for person in copied_db.people if person.email is None]
-
-        copied_db.copy_value_of_property_from_referencelist_if_empty_and_all_other_properties_match_except_exclusion_list(
-            property="email",
-            referencelist=backup_db.people,
-            exclusion_list=["category", "tags", "riegen_coach", "riegen_member"],
+        recovered_emails = (
+            self.main_db.find_missing_values_of_property_in_referencelist(
+                property="email",
+                referencelist=backup_db.people,
+                exclusion_list=["category", "tags", "riegen_coach", "riegen_member"],
+            )
         )
-        people_lost_email = [
-            person for person in people_no_mail if person.email is not None
-        ]
+        people_lost_email = []
+        for person, email in recovered_emails:
+            person_with_email = copy.copy(person)
+            person_with_email.email = email
+            people_lost_email.append(person_with_email)
+        return people_lost_email
+
+    def _report_lost_emails(self, people_lost_email: list[Person]):
         if len(people_lost_email) == 0:
             return
         for person in people_lost_email:
@@ -1,11 +1,18 @@
 import json
 import pandas as pd
-from pathlib import Path
-from src.utils.databases import Database, HouseBasedDatabase, HouseBasedFamily, Person
+from src.utils.databases import (
+    Database,
+    DatabaseQuery,
+    HouseBasedDatabase,
+    HouseBasedFamily,
+)
+from src.utils.writers import write_df
 
 
 class AdressDatabase:
-    def __init__(self, input_file: str = None, input_db: Database = None):
+    def __init__(
+        self, input_file: str = None, input_db: Database | DatabaseQuery = None
+    ):
         self.columns = [
             "Vorname",
             "Nachname",
@@ -23,7 +30,7 @@ class AdressDatabase:
         self._database = input_db
         self.input_file = input_file
 
-        assert self._database or self.input_file
+        assert self._database is not None or self.input_file is not None
 
     @property
     def df(self):
@@ -37,42 +44,31 @@ class AdressDatabase:
             self._database = Database(self.input_file)
         return self._database
 
-    def __create_from_database(self, db: Database):
-        self._df = pd.DataFrame(columns=self.columns)
-        for person in db.people:
-            self.__add_entry(person)
-
-    def __add_entry(self, person: Person):
-        entry_constructor_dict = {}
+    def __create_from_database(self, db: Database | DatabaseQuery):
         with open("src/utils/STVAdmin_to_AdressDB_translator.json", "r") as f:
             translator = json.load(f)
+        columns = {}
         for col in self.columns:
             if col == "Anrede":
-                entry_constructor_dict[col] = (
-                    "Liebe"
-                    if getattr(person, translator["Geschlecht"]) == "Weiblich"
-                    else "Lieber"
-                )
                 continue
-            entry_constructor_dict[col] = getattr(person, translator[col])
+            columns[col] = [getattr(person, translator[col]) for person in db.people]
+        columns["Anrede"] = [
+            "Liebe" if gender == "Weiblich" else "Lieber"
+            for gender in columns["Geschlecht"]
+        ]
 
-        assert set(entry_constructor_dict.keys()) == set(self.columns)
+        assert set(columns.keys()) == set(self.columns)
 
-        entry_constructor_dict = {
-            key: [value] for key, value in entry_constructor_dict.items()
-        }
+        self._df = pd.DataFrame(columns, columns=self.columns, dtype=object)
 
-        self._df = pd.concat([self._df, pd.DataFrame.from_dict(entry_constructor_dict)])
+    def write(self, filename: str, writer: str = "xlsx") -> str:
+        return write_df(self.df, filename, writer=writer)
 
-    def to_csv(self, filename: str):
-        path = Path(filename).parent
-        path.mkdir(parents=True, exist_ok=True)
-        self.df.to_csv(filename, index=False)
+    def to_csv(self, filename: str) -> str:
+        return self.write(filename, writer="csv")
 
-    def to_excel(self, filename: str):
-        path = Path(filename).parent
-        path.mkdir(parents=True, exist_ok=True)
-        self.df.to_excel(filename, index=False)
+    def to_excel(self, filename: str) -> str:
+        return self.write(filename, writer="xlsx")
 
 
 class RiegenAdressDatabase:
@@ -83,10 +79,11 @@ class RiegenAdressDatabase:
         coach_df["Funktion"] = "Leiter*in"
         self.df = pd.concat([member_df, coach_df])
 
-    def to_excel(self, filename: str):
-        path = Path(filename).parent
-        path.mkdir(parents=True, exist_ok=True)
-        self.df.to_excel(filename, index=False)
+    def write(self, filename: str, writer: str = "xlsx") -> str:
+        return write_df(self.df, filename, writer=writer)
+
+    def to_excel(self, filename: str) -> str:
+        return self.write(filename, writer="xlsx")
 
 
 class HouseBasedAdressDatabase:
@@ -106,41 +103,38 @@ class HouseBasedAdressDatabase:
         return self._df
 
     def __create_from_house_based_database(self, hb_db: HouseBasedDatabase):
-        self._df = pd.DataFrame(columns=self.columns)
-        for hbfamily in hb_db.house_based_families:
-            self.__add_family_entry(hbfamily)
+        records = [
+            self.__get_family_record(hbfamily)
+            for hbfamily in hb_db.house_based_families
+        ]
+        self._df = pd.DataFrame.from_records(records, columns=self.columns).astype(
+            object
+        )
         self._df.sort_values(
             by=["PLZ", "Ort", "Strasse", "Name"], inplace=True, ignore_index=True
         )
 
-    def __add_family_entry(self, hbfamily: HouseBasedFamily):
-        entry_constructor_dict = {}
+    def __get_family_record(self, hbfamily: HouseBasedFamily) -> dict:
+        record = {}
         if len(hbfamily.people) > 1:
             last_names = {person.last_name for person in hbfamily.people}
-            entry_constructor_dict["Name"] = "Fam. " + " & ".join(sorted(last_names))
+            record["Name"] = "Fam. " + " & ".join(sorted(last_names))
         else:
-            entry_constructor_dict["Name"] = (
+            record["Name"] = (
                 f"{hbfamily.people[0].first_name} {hbfamily.people[0].last_name}"
             )
-        entry_constructor_dict["Strasse"] = hbfamily.street
-        entry_constructor_dict["PLZ"] = hbfamily.plz
-        entry_constructor_dict["Ort"] = hbfamily.city
-        person_list = []
-        for person in hbfamily.people:
-            person_list.append(f"{person.first_name} {person.last_name}")
-
-        entry_constructor_dict = {
-            key: [value] for key, value in entry_constructor_dict.items()
-        }
-        entry_constructor_dict["Personen"] = ", ".join(person_list)
-
-        assert set(entry_constructor_dict.keys()) == set(self.columns)
-        self._df = pd.concat(
-            [self._df, pd.DataFrame.from_dict(entry_constructor_dict)],
-            ignore_index=True,
+        record["Strasse"] = hbfamily.street
+        record["PLZ"] = hbfamily.plz
+        record["Ort"] = hbfamily.city
+        record["Personen"] = ", ".join(
+            f"{person.first_name} {person.last_name}" for person in hbfamily.people
         )
 
-    def to_excel(self, filename: str):
-        path = Path(filename).parent
-        path.mkdir(parents=True, exist_ok=True)
-        self.df.to_excel(filename, index=False)
+        assert set(record.keys()) == set(self.columns)
+        return record
+
+    def write(self, filename: str, writer: str = "xlsx") -> str:
+        return write_df(self.df, filename, writer=writer)
+
+    def to_excel(self, filename: str) -> str:
+        return self.write(filename, writer="xlsx")
@@ -1,7 +1,11 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
+import math
 import requests
+import threading
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
 from attr import dataclass
 from src.utils.credentials import CredentialsBase, CLEVERREACH_ITEM_UUID
 
@@ -36,29 +40,93 @@ class Receiver:
         return {k: v for k, v in self.__dict__.items() if v is not None}
 
 
+@dataclass
+class UpsertResult:
+    group_id: int
+    total: int
+    failed: List[Dict[str, Any]]  # email and status of each receiver not updated
+
+    @property
+    def success(self) -> bool:
+        return len(self.failed) == 0
+
+    @property
+    def failed_emails(self) -> List[str]:
+        return [receiver["email"] for receiver in self.failed]
+
+
+@dataclass
+class ActivationResult:
+    receiver_id: int
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+class RateLimiter:
+    """Spaces out calls to wait() to at most rate per second, across threads."""
+
+    def __init__(self, rate: float):
+        self.interval = 1 / rate
+        self._next_time = time.monotonic()
+        self._lock = threading.Lock()
+
+    def wait(self):
+        with self._lock:
+            now = time.monotonic()
+            wait_time = self._next_time - now
+            self._next_time = max(now, self._next_time) + self.interval
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+
 class CleverreachClient:
     _URL = "https://rest.cleverreach.com"
     _TOKEN_URL = "https://rest.cleverreach.com/oauth/token.php"
 
-    def __init__(self):
+    def __init__(self, pool_size: int = 10):
         self.creds = CredentialsBase(item_uuid=CLEVERREACH_ITEM_UUID)
         self._token = None
         self._token_expiry = None
+        self._token_lock = threading.Lock()
+        self.pool_size = pool_size
+        self.session = self._create_session(pool_size)
 
-    @property
-    def headers(self) -> Dict[str, str]:
-        return self._get_headers()
+    @staticmethod
+    def _create_session(pool_size: int) -> requests.Session:
+        # one keep-alive connection pool shared by all endpoints and threads
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_maxsize=pool_size))
+        session.headers.update(
+            {"Accept-Encoding": "gzip, deflate", "Connection": "keep-alive"}
+        )
+        return session
+
+    def close(self):
+        self.session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
 
     def _get_token(self) -> str:
-        if self._token and time.time() + 60 < self._token_expiry:
-            logger.debug("Using cached CleverReach token")
-            return self._token
+        with self._token_lock:
+            if self._token and time.time() + 60 < self._token_expiry:
+                logger.debug("Using cached CleverReach token")
+                return self._token
+            return self._refresh_token()
 
+    def _refresh_token(self) -> str:
         logger.info("Retrieving new CleverReach access token")
-        response = requests.post(
+        response = self.session.post(
             self._TOKEN_URL,
             auth=(self.creds.client_id, self.creds.client_secret),
             data={"grant_type": "client_credentials"},
+            headers={"Authorization": None},
         )
         if response.status_code != 200:
             logger.error(f"Failed to retrieve CleverReach token: {response.text}")
@@ -66,31 +134,73 @@ class CleverreachClient:
         token_data = response.json()
         self._token = token_data["access_token"]
         self._token_expiry = time.time() + token_data["expires_in"]
+        # attached once per token, not rebuilt for every request
+        self.session.headers["Authorization"] = f"Bearer {self._token}"
         logger.info("Successfully retrieved new CleverReach access token")
         return self._token
 
-    def _get_headers(self) -> Dict[str, str]:
-        return {"Authorization": f"Bearer {self._get_token()}"}
+    def _request(self, method: str, path: str, **kwargs) -> requests.Response:
+        self._get_token()  # refreshes the session's auth header if expired
+        return self.session.request(method, self._URL + path, **kwargs)
 
-    def update_receivers_for_group(self, group_id: str, receivers: list) -> bool:
-        logger.info(f"Updating {len(receivers)} receivers for group {group_id}")
-        path = f"/v3/groups.json/{group_id}/receivers/upsert"
-        res = requests.post(self._URL + path, json=receivers, headers=self.headers)
-        if res.status_code != 200:
-            logger.error(f"Failed to update receivers for group {group_id}: {res.text}")
-            raise Exception(
-                f"Failed to update receivers for group {group_id}: {res.text}"
-            )
-        status_per_receiver = [x["status"] for x in res.json()]
-        if not all(s == "update success" for s in status_per_receiver):
+    def update_receivers_for_group(
+        self,
+        group_id: int,
+        receivers: list,
+        chunk_size: int = 500,
+        max_workers: int = 4,
+        retries: int = 2,
+    ) -> UpsertResult:
+        """Upsert the receivers in chunks, sending up to max_workers chunks at once.
+
+        A chunk whose request fails is retried, receivers that still could not be
+        updated are listed in the result instead of failing the whole upsert.
+        """
+        logger.info(
+            f"Updating {len(receivers)} receivers for group {group_id} in chunks of {chunk_size}"
+        )
+        chunks = [
+            receivers[start : start + chunk_size]
+            for start in range(0, len(receivers), chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=min(max_workers, self.pool_size)) as pool:
+            futures = [
+                pool.submit(self._upsert_chunk, group_id, chunk, retries)
+                for chunk in chunks
+            ]
+            failed = [receiver for future in futures for receiver in future.result()]
+        result = UpsertResult(group_id=group_id, total=len(receivers), failed=failed)
+        if result.success:
+            logger.info(f"Successfully updated receivers for group {group_id}")
+        else:
             logger.error(
-                f"Failed to update some receivers for group {group_id}: {res.json()}"
+                f"Failed to update {len(failed)} of {len(receivers)} receivers for group {group_id}: {failed}"
             )
-            raise Exception(
-                f"Failed to update receivers for group {group_id}: {res.json()}"
+        return result
+
+    def _upsert_chunk(self, group_id: int, chunk: list, retries: int) -> list[dict]:
+        path = f"/v3/groups.json/{group_id}/receivers/upsert"
+        for attempt in range(retries + 1):
+            try:
+                res = self._request("POST", path, json=chunk)
+            except requests.RequestException as e:
+                error = repr(e)
+            else:
+                if res.status_code == 200:
+                    statuses = [x["status"] for x in res.json()]
+                    statuses += [None] * (len(chunk) - len(statuses))
+                    return [
+                        {"email": receiver["email"], "status": status}
+                        for receiver, status in zip(chunk, statuses)
+                        if status != "update success"
+                    ]
+                error = res.text
+            logger.warning(
+                f"Failed to upsert {len(chunk)} receivers for group {group_id} (attempt {attempt + 1}/{retries + 1}): {error}"
             )
-        logger.info(f"Successfully updated receivers for group {group_id}")
-        return True
+            if attempt < retries:
+                time.sleep(2**attempt)
+        return [{"email": receiver["email"], "status": error} for receiver in chunk]
 
     def get_receivers_for_group(
         self,
@@ -112,7 +222,7 @@ class CleverreachClient:
             params["page"] = page
         if type is not None:
             params["type"] = type
-        res = requests.get(self._URL + path, headers=self.headers, params=params)
+        res = self._request("GET", path, params=params)
         if res.status_code != 200:
             logger.error(f"Failed to get receivers for group {group_id}: {res.text}")
             raise Exception(f"Failed to get receivers for group {group_id}: {res.text}")
@@ -121,7 +231,7 @@ class CleverreachClient:
         return receivers
 
     def get_receivers_for_group_complete(
-        self, group_id: int, type: Optional[str] = None
+        self, group_id: int, type: Optional[str] = None, max_workers: int = 4
     ) -> list:
         stats = self.get_group_stats(group_id)
         if type is None or type == "all":
@@ -136,23 +246,17 @@ class CleverreachClient:
             raise ValueError(
                 "type must be one of 'active', 'inactive', 'all', 'bounce'"
             )
-        all_receivers = []
-        page = 0
-        while len(all_receivers) < total_count:
-            receivers = self.get_receivers_for_group(group_id, page=page, type=type)
-            if len(receivers) == 0:
-                logger.warning(
-                    f"Received empty receiver list for group {group_id} on page {page} without reaching total count {total_count}. Stopping pagination to avoid infinite loop."
-                )
-                break
-            all_receivers.extend(receivers)
-            page += 1
-        return all_receivers
+        return self._get_all_pages(
+            lambda page: self.get_receivers_for_group(group_id, page=page, type=type),
+            total_count=total_count,
+            description=f"group {group_id}",
+            max_workers=max_workers,
+        )
 
     def get_attributes(self) -> list:
         logger.info("Retrieving CleverReach attributes")
         path = "/v3/attributes.json"
-        res = requests.get(self._URL + path, headers=self.headers)
+        res = self._request("GET", path)
         if res.status_code != 200:
             logger.error(f"Failed to get attributes: {res.text}")
             raise Exception(f"Failed to get attributes: {res.text}")
@@ -163,7 +267,7 @@ class CleverreachClient:
     def get_filter(self, group_id: int, filter_id: int) -> dict:
         logger.info(f"Retrieving filter {filter_id}")
         path = f"/v3/groups.json/{group_id}/filters/{filter_id}"
-        res = requests.get(self._URL + path, headers=self.headers)
+        res = self._request("GET", path)
         if res.status_code != 200:
             logger.error(f"Failed to get filter {filter_id}: {res.text}")
             raise Exception(f"Failed to get filter {filter_id}: {res.text}")
@@ -174,7 +278,7 @@ class CleverreachClient:
     def update_filter(self, group_id: int, filter_id: int, filter_data: dict) -> bool:
         logger.info(f"Updating filter {filter_id}")
         path = f"/v3/groups.json/{group_id}/filters/{filter_id}"
-        res = requests.put(self._URL + path, json=filter_data, headers=self.headers)
+        res = self._request("PUT", path, json=filter_data)
         if res.status_code != 200:
             logger.error(f"Failed to update filter {filter_id}: {res.text}")
             raise Exception(f"Failed to update filter {filter_id}: {res.text}")
@@ -184,7 +288,7 @@ class CleverreachClient:
     def delete_receivers(self, group_id: int, receivers: list[str]) -> bool:
         logger.info(f"Deleting {len(receivers)} receivers from group {group_id}")
         path = f"/v3/groups.json/{group_id}/receivers/delete"
-        res = requests.post(self._URL + path, json=receivers, headers=self.headers)
+        res = self._request("POST", path, json=receivers)
         if res.status_code != 200:
             logger.error(
                 f"Failed to delete receivers from group {group_id}: {res.text}"
@@ -215,7 +319,7 @@ class CleverreachClient:
             params["pagesize"] = pagesize
         if page is not None:
             params["page"] = page
-        res = requests.get(self._URL + path, headers=self.headers, params=params)
+        res = self._request("GET", path, params=params)
         if res.status_code != 200:
             logger.error(
                 f"Failed to get filtered receivers for group {group_id} with filter {filter_id}, page {page}, pagesize {pagesize}: {res.text}"
@@ -230,20 +334,47 @@ class CleverreachClient:
         return receivers
 
     def get_receivers_for_group_filtered_complete(
-        self, group_id: int, filter_id: int
+        self, group_id: int, filter_id: int, max_workers: int = 4
     ) -> list:
         total_count = self.get_group_stats_based_on_filter(group_id, filter_id)[
             "total_count"
         ]
+        return self._get_all_pages(
+            lambda page: self.get_receivers_for_group_filtered(
+                group_id, filter_id, page=page
+            ),
+            total_count=total_count,
+            description=f"group {group_id} with filter {filter_id}",
+            max_workers=max_workers,
+        )
+
+    def _get_all_pages(
+        self,
+        get_page: Callable[[int], list],
+        total_count: int,
+        description: str,
+        max_workers: int,
+    ) -> list:
+        """Fetch the first page, then the remaining pages concurrently."""
+        pages = []
+        if total_count > 0:
+            pages.append(get_page(0))
+        # the server's default page size, which every page is requested with
+        pagesize = len(pages[0]) if pages else 0
+        if 0 < pagesize < total_count:
+            num_pages = math.ceil(total_count / pagesize)
+            with ThreadPoolExecutor(
+                max_workers=min(max_workers, self.pool_size)
+            ) as pool:
+                pages += list(pool.map(get_page, range(1, num_pages)))
+
         all_receivers = []
         page = 0
         while len(all_receivers) < total_count:
-            receivers = self.get_receivers_for_group_filtered(
-                group_id, filter_id, page=page
-            )
+            receivers = pages[page] if page < len(pages) else get_page(page)
             if len(receivers) == 0:
                 logger.warning(
-                    f"Received empty receiver list for group {group_id} with filter {filter_id} on page {page} without reaching total count {total_count}. Stopping pagination to avoid infinite loop."
+                    f"Received empty receiver list for {description} on page {page} without reaching total count {total_count}. Stopping pagination to avoid infinite loop."
                 )
                 break
             all_receivers.extend(receivers)
@@ -253,7 +384,7 @@ class CleverreachClient:
     def get_group_stats(self, group_id: int) -> int:
         logger.info(f"Retrieving group statistics for group {group_id}")
         path = f"/v3/groups.json/{group_id}/stats"
-        res = requests.get(self._URL + path, headers=self.headers)
+        res = self._request("GET", path)
         if res.status_code != 200:
             logger.error(
                 f"Failed to get group statistics for group {group_id}: {res.text}"
@@ -270,7 +401,7 @@ class CleverreachClient:
             f"Retrieving group statistics for group {group_id} based on filter {filter_id}"
         )
         path = f"/v3/groups.json/{group_id}/filters/{filter_id}/stats"
-        res = requests.get(self._URL + path, headers=self.headers)
+        res = self._request("GET", path)
         if res.status_code != 200:
             logger.error(
                 f"Failed to get group statistics for group {group_id}: {res.text}"
@@ -285,7 +416,7 @@ class CleverreachClient:
     def activate_receiver(self, group_id: int, receiver_id: int) -> bool:
         logger.info(f"Activating receiver {receiver_id} in group {group_id}")
         path = f"/v3/groups.json/{group_id}/receivers/{receiver_id}/activate"
-        res = requests.put(self._URL + path, headers=self.headers)
+        res = self._request("PUT", path)
         if res.status_code != 200:
             logger.error(
                 f"Failed to activate receiver {receiver_id} in group {group_id}: {res.text}"
@@ -297,3 +428,35 @@ class CleverreachClient:
             f"Successfully activated receiver {receiver_id} in group {group_id}"
         )
         return res.json()
+
+    def activate_receivers(
+        self,
+        group_id: int,
+        receiver_ids: list[int],
+        max_workers: int = 4,
+        requests_per_second: float = 10,
+    ) -> list[ActivationResult]:
+        """Activate the receivers concurrently, at most requests_per_second.
+
+        Returns one result per receiver, in the order of receiver_ids. A failed
+        activation does not stop the others.
+        """
+        logger.info(f"Activating {len(receiver_ids)} receivers in group {group_id}")
+        rate_limiter = RateLimiter(requests_per_second)
+
+        def activate(receiver_id: int) -> ActivationResult:
+            rate_limiter.wait()
+            try:
+                self.activate_receiver(group_id=group_id, receiver_id=receiver_id)
+            except Exception as e:
+                return ActivationResult(receiver_id=receiver_id, error=str(e))
+            return ActivationResult(receiver_id=receiver_id)
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, self.pool_size)) as pool:
+            results = list(pool.map(activate, receiver_ids))
+        failed = [result.receiver_id for result in results if not result.success]
+        if failed:
+            logger.error(
+                f"Failed to activate {len(failed)} of {len(receiver_ids)} receivers in group {group_id}: {failed}"
+            )
+        return results
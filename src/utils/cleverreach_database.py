@@ -1,9 +1,13 @@
 import json
+import logging
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from src.utils.databases import MailBasedFamily, MailBasedDatabase
+from src.utils.databases import MailBasedDatabase, MailBasedFamily
 from src.utils.cleverreach_client import Receiver
 
+logger = logging.getLogger(__name__)
+
 
 class CleverreachDatabase:
     def __init__(
@@ -37,47 +41,55 @@ class CleverreachDatabase:
         return self._mb_database
 
     def __create_from_mail_based_database(self, mb_db: MailBasedDatabase):
-        self._df = pd.DataFrame(columns=self.columns)
-        for mbfamily in mb_db.mail_based_families:
-            if mbfamily.email:
-                self.__add_entry(mbfamily)
-
-    def __add_entry(self, mbfamily: MailBasedFamily):
-        entry_constructor_dict = {}
-        entry_constructor_dict["Email"] = mbfamily.email
-        entry_constructor_dict["firstname"] = (
-            self._concatenate_unique_list_entries_to_string(
-                mbfamily.get_property_list("first_name")
+        mbfamilies = [
+            mbfamily for mbfamily in mb_db.mail_based_families if mbfamily.email
+        ]
+        columns = {
+            "firstname": [],
+            "lastname": [],
+            "Email": [],
+            "maennlich": [],
+            "weiblich": [],
+        }
+        translator = self._get_translator()
+        category_to_column = {
+            translator[category]: idx for idx, category in enumerate(self.categories)
+        }
+        category_flags = np.zeros((len(mbfamilies), len(self.categories)), dtype=bool)
+        for family_idx, mbfamily in enumerate(mbfamilies):
+            columns["Email"].append(mbfamily.email)
+            columns["firstname"].append(
+                self._concatenate_unique_list_entries_to_string(
+                    mbfamily.get_property_list("first_name")
+                )
             )
-        )
-        entry_constructor_dict["lastname"] = (
-            self._concatenate_unique_list_entries_to_string(
-                mbfamily.get_property_list("last_name")
+            columns["lastname"].append(
+                self._concatenate_unique_list_entries_to_string(
+                    mbfamily.get_property_list("last_name")
+                )
             )
-        )
-
-        entry_constructor_dict["updated"] = (
+            mbfamily_genders = {
+                person.gender.lower().replace("ä", "ae")
+                for person in mbfamily.people
+                if isinstance(person.gender, str)
+            }
+            for gender in ["maennlich", "weiblich"]:
+                columns[gender].append(gender in mbfamily_genders)
+            for person in mbfamily.people:
+                if person.category in category_to_column:
+                    category_flags[family_idx, category_to_column[person.category]] = (
+                        True
+                    )
+
+        columns["updated"] = [
             pd.Timestamp.today().floor(freq="D").strftime("%d.%m.%Y")
-        )
-
-        mbfamily_genders = mbfamily.get_property_list("gender")
-        mbfamily_genders = [gender.lower() for gender in mbfamily_genders]
-        mbfamily_genders = [gender.replace("ä", "ae") for gender in mbfamily_genders]
-        for gender in ["maennlich", "weiblich"]:
-            entry_constructor_dict[gender] = gender in mbfamily_genders
-        translator = self._get_translator()
-        for category in self.categories:
-            entry_constructor_dict[category] = translator[
-                category
-            ] in mbfamily.get_property_list("category")
+        ] * len(mbfamilies)
+        for idx, category in enumerate(self.categories):
+            columns[category] = category_flags[:, idx].tolist()
 
-        assert set(entry_constructor_dict.keys()) == set(self.columns)
+        assert set(columns.keys()) == set(self.columns)
 
-        entry_constructor_dict = {
-            key: [value] for key, value in entry_constructor_dict.items()
-        }
-
-        self._df = pd.concat([self._df, pd.DataFrame.from_dict(entry_constructor_dict)])
+        self._df = pd.DataFrame(columns, columns=self.columns, dtype=object)
 
     def _concatenate_unique_list_entries_to_string(self, input_list: list) -> str:
         input_list = [str(entry) for entry in input_list]
@@ -91,16 +103,59 @@ class CleverreachDatabase:
         path.mkdir(parents=True, exist_ok=True)
         df_copy.to_csv(filename, index=False)
 
-    def to_receivers(self) -> list[Receiver]:
+    def to_receivers(self) -> list[dict]:
+        attribute_columns = [column for column in self.df.columns if column != "Email"]
         receivers = []
-        for _, row in self.df.iterrows():
-            receiver = Receiver(email=row["Email"], global_attributes={})
-            for column in self.df.columns:
-                if column not in ["Email"]:
-                    receiver.global_attributes[column] = str(row[column])
+        for record in self.df.to_dict("records"):
+            receiver = Receiver(
+                email=record["Email"],
+                global_attributes={
+                    column: str(record[column]) for column in attribute_columns
+                },
+            )
             receivers.append(receiver.to_dict())
         return receivers
 
+    def to_receivers_delta(self, current_receivers: list[dict]) -> list[dict]:
+        """Like to_receivers, but only new or changed receivers are sent in full.
+
+        current_receivers are the receivers as returned by CleverReach. Those
+        whose global attributes already match only get "updated" refreshed, so
+        they do not end up in the ausgetreten filter.
+        """
+        current_attributes = {
+            MailBasedFamily.normalize_email(receiver.get("email")): {
+                str(key).lower(): str(value)
+                for key, value in (receiver.get("global_attributes") or {}).items()
+            }
+            for receiver in current_receivers
+        }
+        receivers = []
+        num_changed = 0
+        for receiver in self.to_receivers():
+            attributes = current_attributes.get(
+                MailBasedFamily.normalize_email(receiver["email"])
+            )
+            global_attributes = receiver["global_attributes"]
+            if attributes is None or any(
+                attributes.get(key.lower()) != value
+                for key, value in global_attributes.items()
+                if key != "updated"
+            ):
+                num_changed += 1
+                receivers.append(receiver)
+                continue
+            receivers.append(
+                Receiver(
+                    email=receiver["email"],
+                    global_attributes={"updated": global_attributes["updated"]},
+                ).to_dict()
+            )
+        logger.info(
+            f"{num_changed} of {len(receivers)} receivers are new or changed in CleverReach"
+        )
+        return receivers
+
     def _get_translator(self) -> dict:
         with open(
             "src/utils/STVAdmin_to_Cleverreach_category_translator.json", "r"
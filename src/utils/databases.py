@@ -1,7 +1,9 @@
 import pandas as pd
 import numpy as np
 import json
-from typing import Optional
+import datetime
+from bisect import bisect_left
+from typing import Any, Iterable, Optional
 
 
 EXCEPTIONS_MEMBER_NUMBERS = [
@@ -11,6 +13,30 @@ EXCEPTIONS_MEMBER_NUMBERS = [
 
 
 class Person:
+    __slots__ = (
+        "member_number",
+        "gender",
+        "first_name",
+        "last_name",
+        "street",
+        "plz",
+        "city",
+        "_birthday",
+        "_email",
+        "emails",
+        "phone_p",
+        "phone_m",
+        "phone_g",
+        "category",
+        "_date_added",
+        "riegen_member",
+        "riegen_coach",
+        "tags",
+        "printed_magazine",
+    )
+    # public names of the slots above, e.g. "birthday" instead of "_birthday"
+    PROPERTIES = tuple(slot.lstrip("_") for slot in __slots__)
+
     def __init__(
         self,
         member_number: int = None,
@@ -104,14 +130,13 @@ class Person:
     def age(self):
         if not isinstance(self.birthday, pd.Timestamp):
             return None
-        now = pd.Timestamp.now()
-        return self.calculate_age_at_ts(now)
+        return self.calculate_age_at_ts(datetime.date.today())
 
     @age.setter
     def age(self, value):
         pass
 
-    def calculate_age_at_ts(self, ts: pd.Timestamp) -> int:
+    def calculate_age_at_ts(self, ts: pd.Timestamp | datetime.date) -> int:
         assert isinstance(self.birthday, pd.Timestamp)
 
         age = ts.year - self.birthday.year
@@ -135,16 +160,123 @@ class Person:
         return x.replace(" ", "")
 
 
+class PersonTable:
+    """Column-wise snapshot of a list of people.
+
+    Row i of the table describes people[i], so boolean masks computed on the
+    columns can be turned back into the original Person objects with select.
+    """
+
+    COLUMNS = [
+        "member_number",
+        "gender",
+        "first_name",
+        "last_name",
+        "street",
+        "plz",
+        "city",
+        "birthday",
+        "email",
+        "category",
+        "date_added",
+        "printed_magazine",
+    ]
+    DATE_COLUMNS = ["birthday", "date_added"]
+    CATEGORICAL_COLUMNS = ["category", "gender"]
+
+    def __init__(self, people: list[Person]):
+        self.people = list(people)
+        self.df = pd.DataFrame(
+            {
+                column: [getattr(person, column, None) for person in self.people]
+                for column in self.COLUMNS
+            }
+        )
+        for column in self.DATE_COLUMNS:
+            self.df[column] = pd.to_datetime(self.df[column], errors="coerce")
+        for column in self.CATEGORICAL_COLUMNS:
+            self.df[column] = self.df[column].astype("category")
+        self.df["member_number"] = self.df["member_number"].astype("Int64")
+        self.df["printed_magazine"] = self.df["printed_magazine"].astype("boolean")
+        self.tags = [person.tags for person in self.people]
+
+    def __len__(self):
+        return len(self.people)
+
+    def mask(self, property: str, search_input, comparator=None) -> np.ndarray:
+        column = self.df[property]
+        if comparator is None or comparator is np.equal:
+            if search_input is None:
+                return column.isna().to_numpy()
+            result = column == search_input
+        else:
+            result = comparator(column, search_input)
+        result = pd.Series(result, index=column.index).fillna(False).astype(bool)
+        return (column.notna() & result).to_numpy()
+
+    def isin(self, property: str, values: list) -> np.ndarray:
+        return self.df[property].isin(values).to_numpy()
+
+    def has_tag(self, tag: str) -> np.ndarray:
+        return np.fromiter((tag in tags for tags in self.tags), bool, len(self))
+
+    def ages(self, ts: Optional[pd.Timestamp] = None) -> pd.Series:
+        ts = ts if ts is not None else pd.Timestamp.now()
+        birthday = self.df["birthday"]
+        had_no_birthday_yet = (birthday.dt.month > ts.month) | (
+            (birthday.dt.month == ts.month) & (birthday.dt.day > ts.day)
+        )
+        return (ts.year - birthday.dt.year - had_no_birthday_yet).astype("Int64")
+
+    def select(self, mask: np.ndarray) -> list[Person]:
+        return [self.people[position] for position in np.flatnonzero(mask)]
+
+
 class Database:
+    # Properties with a hash index (value -> positions in self.people). They are
+    # kept up to date by add_people and the mutation helpers below, so any
+    # change to these properties has to go through _set_property.
+    INDEXED_PROPERTIES = [
+        "member_number",
+        "email",
+        "emails",
+        "category",
+        "printed_magazine",
+    ]
+    # Properties with a sorted range index. Those are built lazily once per
+    # snapshot, i.e. until the next write to the database.
+    RANGE_INDEXED_PROPERTIES = ["birthday", "date_added"]
+
     def __init__(self, input_file: str = None):
         self.people = []
         self.riegen = None
+        self.version = 0
+        self._indexes = {property: {} for property in self.INDEXED_PROPERTIES}
+        self._snapshot_cache = {}
         if input_file is not None:
-            self.people = self._load_people_from_input_file(input_file)
+            self.add_people(self._load_people_from_input_file(input_file))
+
+    def __getstate__(self):
+        # snapshot caches are cheap to rebuild, no need to pickle / copy them
+        state = self.__dict__.copy()
+        state["_snapshot_cache"] = {}
+        return state
 
     def lookup_by_property(
         self, property: str, search_input, comparator=None
     ) -> list[Person]:
+        if comparator in [None, np.equal] and property in self._indexes:
+            try:
+                positions = self._indexes[property].get(search_input, set())
+            except TypeError:  # unhashable search input, fall back to a scan
+                pass
+            else:
+                return [self.people[position] for position in sorted(positions)]
+        if property in self.RANGE_INDEXED_PROPERTIES:
+            if comparator is np.greater_equal:
+                return self.lookup_range(property, begin=search_input)
+            if comparator is np.less:
+                return self.lookup_range(property, end=search_input)
         comparator = comparator or np.equal
         people_found = []
         for person in self.people:
@@ -159,11 +291,119 @@ class Database:
         if tags is not None:
             for person in people_list:
                 person.tags = person.tags.union(tags)
-        self.people += people_list
+        for person in people_list:
+            self.people.append(person)
+            self._add_to_indexes(len(self.people) - 1)
+        self._invalidate_snapshot()
+
+    def lookup_by_values(self, property: str, values: list) -> list[Person]:
+        if property in self._indexes:
+            positions = set()
+            for value in values:
+                positions.update(self._indexes[property].get(value, set()))
+            return [self.people[position] for position in sorted(positions)]
+        return [
+            person
+            for person in self.people
+            if getattr(person, property, None) in values
+        ]
+
+    def lookup_range(self, property: str, begin=None, end=None) -> list[Person]:
+        """Return all people with begin <= property < end, in database order.
+
+        Omitting begin or end leaves that side of the range open. People without
+        a value for the property are never returned.
+        """
+        if property not in self.RANGE_INDEXED_PROPERTIES:
+            raise ValueError(f"No range index for property {property}")
+        positions = self._get_indexed_positions(property, "between", (begin, end))
+        return [self.people[position] for position in sorted(positions)]
+
+    def query(self) -> "DatabaseQuery":
+        return DatabaseQuery(self)
+
+    def _get_range_index(self, property: str) -> tuple[list, list[int]]:
+        key = ("range_index", property)
+        if key not in self._snapshot_cache:
+            entries = []
+            for position, person in enumerate(self.people):
+                value = getattr(person, property, None)
+                if isinstance(value, pd.Timestamp) and not pd.isna(value):
+                    entries.append((value, position))
+            entries.sort(key=lambda entry: entry[0])
+            self._snapshot_cache[key] = (
+                [value for value, _ in entries],
+                [position for _, position in entries],
+            )
+        return self._snapshot_cache[key]
+
+    def _get_indexed_positions(
+        self, property: str, operator: str, value
+    ) -> Optional[set[int]]:
+        """Positions matching the condition, None if no index can answer it."""
+        if property in self._indexes and operator in ["eq", "in"]:
+            index = self._indexes[property]
+            values = [value] if operator == "eq" else value
+            try:
+                return set().union(*[index.get(value, set()) for value in values])
+            except TypeError:  # unhashable value, needs a scan
+                return None
+        if property in self.RANGE_INDEXED_PROPERTIES and operator in [
+            "between",
+            "gte",
+            "lt",
+        ]:
+            begin, end = {
+                "between": value,
+                "gte": (value, None),
+                "lt": (None, value),
+            }[operator]
+            values, positions = self._get_range_index(property)
+            start = 0 if begin is None else bisect_left(values, begin)
+            stop = len(values) if end is None else bisect_left(values, end)
+            return set(positions[start:stop])
+        return None
+
+    def _invalidate_snapshot(self):
+        self.version += 1
+        self._snapshot_cache = {}
+
+    def _index_keys(self, person: Person, property: str) -> list:
+        if property == "emails":
+            return list(person.emails) if person.emails else [None]
+        return [getattr(person, property, None)]
+
+    def _add_to_indexes(self, position: int):
+        person = self.people[position]
+        for property, index in self._indexes.items():
+            for key in self._index_keys(person, property):
+                index.setdefault(key, set()).add(position)
+
+    def _remove_from_indexes(self, position: int):
+        person = self.people[position]
+        for property, index in self._indexes.items():
+            for key in self._index_keys(person, property):
+                positions = index.get(key)
+                if positions is None:
+                    continue
+                positions.discard(position)
+                if not positions:
+                    del index[key]
+
+    def _set_property(self, position: int, property: str, value: Any):
+        self._invalidate_snapshot()
+        if property not in self._indexes:
+            setattr(self.people[position], property, value)
+            return
+        # email and emails are coupled on Person, hence all indexes are refreshed
+        self._remove_from_indexes(position)
+        setattr(self.people[position], property, value)
+        self._add_to_indexes(position)
 
     def add_tag_to_all(self, tag: str):
         for person in self.people:
             person.tags.add(tag)
+        self._invalidate_snapshot()
 
     def _load_people_from_input_file(self, input_file: str) -> list[Person]:
         input_df = self.__load_input_file(input_file)
@@ -171,30 +411,44 @@ class Database:
         people_list = []
         with open("src/utils/STVAdmin_export_translator.json", "r") as f:
             translator = json.load(f)
-        for idx in input_df.index:
-            row = input_df.loc[idx, :]
-            person_constructor_dict = {}
-            for key in translator:
-                if key in ["riege", "organ"]:
-                    continue
-                if key == "printed_magazine":
-                    value = getattr(row, translator[key], None)
-                    if value == "VEREINSZEITSCHRIFT" or value is None:
-                        person_constructor_dict[key] = False
-                    else:
-                        person_constructor_dict[key] = True
-                    continue
-                if isinstance(translator[key], str):
-                    person_constructor_dict[key] = getattr(row, translator[key], None)
-                if isinstance(translator[key], list):
-                    person_constructor_dict[key] = [
-                        getattr(row, sub_key, None) for sub_key in translator[key]
-                    ]
-
-            people_list.append(Person(**person_constructor_dict))
+        for key in ["birthday", "date_added"]:
+            if translator[key] in input_df.columns:
+                input_df[translator[key]] = pd.to_datetime(
+                    input_df[translator[key]], format="mixed", errors="coerce"
+                )
+        person_constructor_columns = {}
+        for key, column in translator.items():
+            if key in ["riege", "organ"]:
+                continue
+            if key == "printed_magazine":
+                person_constructor_columns[key] = (
+                    (input_df[column] != "VEREINSZEITSCHRIFT").tolist()
+                    if column in input_df.columns
+                    else [False] * len(input_df)
+                )
+                continue
+            if isinstance(column, str):
+                person_constructor_columns[key] = self._column_to_list(input_df, column)
+            if isinstance(column, list):
+                person_constructor_columns[key] = [
+                    list(values)
+                    for values in zip(
+                        *[self._column_to_list(input_df, sub) for sub in column]
+                    )
+                ]
+
+        keys = list(person_constructor_columns.keys())
+        for values in zip(*person_constructor_columns.values()):
+            people_list.append(Person(**dict(zip(keys, values))))
 
         return people_list
 
+    @staticmethod
+    def _column_to_list(input_df: pd.DataFrame, column: str) -> list:
+        if column not in input_df.columns:
+            return [None] * len(input_df)
+        return input_df[column].tolist()
+
     def load_riegen(self, input_file: str):
         input_df = self.__load_input_file(input_file, "latin1")
         input_df = input_df.dropna(how="all")
@@ -202,26 +456,27 @@ class Database:
             translator = json.load(f)
         with open("src/utils/STVAdmin_organ_to_riegenlist.json", "r") as f:
             organ_to_riegenlist = json.load(f)
+        if translator["member_number"] in input_df.columns:
+            input_df = input_df[
+                ~input_df[translator["member_number"]].isin(EXCEPTIONS_MEMBER_NUMBERS)
+            ]
         unique_riegen = []
-        for idx in input_df.index:
-            row = input_df.loc[idx, :]
-            member_number = getattr(row, translator["member_number"], None)
+        for member_number, riege, organ in zip(
+            self._column_to_list(input_df, translator["member_number"]),
+            self._column_to_list(input_df, translator["riege"]),
+            self._column_to_list(input_df, translator["organ"]),
+        ):
             if member_number is None:
                 continue
-            if member_number in EXCEPTIONS_MEMBER_NUMBERS:
-                continue
             people = self.lookup_by_property("member_number", member_number)
             if len(people) != 1:
                 continue
-            assert len(people) == 1
             person = people[0]
-            riege = getattr(row, translator["riege"], None)
             if riege not in ["Leiter", "Leiterin"]:
                 person.riegen_member.append(riege)
                 if riege not in unique_riegen:
                     unique_riegen.append(riege)
                 continue
-            organ = getattr(row, translator["organ"], None)
             riegenlist = organ_to_riegenlist[organ]
             person.riegen_coach += riegenlist
 
@@ -229,6 +484,7 @@ class Database:
         if "Kitu" not in unique_riegen:
             unique_riegen.append("Kitu")
         self.riegen = unique_riegen
+        self._invalidate_snapshot()
 
     def _load_kitu_separately(self):
         for person in self.people:
@@ -260,20 +516,89 @@ class Database:
     def copy_value_of_property_from_reference_if_empty_and_all_other_properties_match_except_exclusion_list(
         self, property: str, reference: Person, exclusion_list: list[str]
     ):
-        for person in self.people:
-            if self._person_matches_all_properties_present_in_reference_except_property_list(
-                person, reference, [property] + exclusion_list
-            ):
-                if getattr(person, property, None) is None:
-                    setattr(person, property, getattr(reference, property))
+        self.copy_value_of_property_from_referencelist_if_empty_and_all_other_properties_match_except_exclusion_list(
+            property, [reference], exclusion_list
+        )
 
     def copy_value_of_property_from_referencelist_if_empty_and_all_other_properties_match_except_exclusion_list(
         self, property: str, referencelist: list[Person], exclusion_list: list[str]
     ):
-        for reference in referencelist:
-            self.copy_value_of_property_from_reference_if_empty_and_all_other_properties_match_except_exclusion_list(
-                property, reference, exclusion_list
+        for position, value in self._match_missing_values_of_property(
+            property, referencelist, exclusion_list
+        ).items():
+            self._set_property(position, property, value)
+
+    def find_missing_values_of_property_in_referencelist(
+        self, property: str, referencelist: list[Person], exclusion_list: list[str]
+    ) -> list[tuple[Person, Any]]:
+        """Find values for people that have no value for property.
+
+        A reference matches a person if all of its properties that are set are
+        equal to the ones of the person, except for property and the exclusion
+        list. If several references match, the first one wins. The database
+        itself is not modified.
+        """
+        return [
+            (self.people[position], value)
+            for position, value in self._match_missing_values_of_property(
+                property, referencelist, exclusion_list
+            ).items()
+        ]
+
+    def _match_missing_values_of_property(
+        self, property: str, referencelist: list[Person], exclusion_list: list[str]
+    ) -> dict[int, Any]:
+        excluded = self._expand_property_list([property] + exclusion_list)
+        compared = [key for key in Person.PROPERTIES if key not in excluded]
+
+        # references are grouped by the properties they have set, within each
+        # group a composite key of those properties joins them to the people
+        lookups = {}
+        for reference_idx, reference in enumerate(referencelist):
+            value = getattr(reference, property, None)
+            if value is None:
+                continue
+            signature = tuple(
+                key for key in compared if getattr(reference, key) is not None
             )
+            values = [getattr(reference, key) for key in signature]
+            if any(self._is_missing(x) for x in values):
+                continue  # NaN / NaT never compare equal, nothing can match
+            key = tuple(self._hashable(x) for x in values)
+            lookups.setdefault(signature, {}).setdefault(key, (reference_idx, value))
+
+        matches = {}
+        for signature, lookup in lookups.items():
+            for position, person in enumerate(self.people):
+                if getattr(person, property, None) is not None:
+                    continue
+                key = tuple(self._hashable(getattr(person, x)) for x in signature)
+                match = lookup.get(key)
+                if match is None:
+                    continue
+                if position not in matches or match[0] < matches[position][0]:
+                    matches[position] = match
+        return {position: value for position, (_, value) in sorted(matches.items())}
+
+    @staticmethod
+    def _expand_property_list(property_list: list[str]) -> set[str]:
+        if "email" in property_list:
+            return set(property_list) | {"emails"}
+        return set(property_list)
+
+    @staticmethod
+    def _hashable(value):
+        if isinstance(value, list):
+            return tuple(value)
+        if isinstance(value, set):
+            return frozenset(value)
+        return value
+
+    @staticmethod
+    def _is_missing(value) -> bool:
+        if isinstance(value, (list, set, tuple)):
+            return False
+        return bool(pd.isna(value))
 
     def remove_property_for_people_matching_removelist(
         self, property: str, removelist: list[Person]
@@ -286,11 +611,11 @@ class Database:
     def remove_property_for_people_matching_reference(
         self, property: str, reference: Person
     ):
-        for person in self.people:
+        for position, person in enumerate(self.people):
             if self._person_matches_all_properties_present_in_reference(
                 person, reference
             ):
-                setattr(person, property, None)
+                self._set_property(position, property, None)
 
     def _person_matches_all_properties_present_in_reference(
         self, person: Person, reference: Person
@@ -303,35 +628,187 @@ class Database:
     def _person_matches_all_properties_present_in_reference_except_property_list(
         person: Person, reference: Person, property_list: list[str]
     ):
-        for key, value in vars(reference).items():
-            if "email" in property_list:
-                property_list.append("emails")
-            if key in property_list:
+        excluded = Database._expand_property_list(property_list)
+        for key in Person.PROPERTIES:
+            if key in excluded:
                 continue
+            value = getattr(reference, key)
             if value is None:
                 continue
-            if getattr(person, key) != getattr(reference, key):
+            if getattr(person, key) != value:
                 return False
         return True
 
     def remove_value_for_property_from_people(self, value: str, property: str):
-        for person in self.people:
-            if isinstance(getattr(person, property), list):
-                setattr(
-                    person,
-                    property,
-                    [x for x in getattr(person, property) if x != value],
-                )
+        self.remove_values_for_property_from_people({value}, property)
+
+    def remove_values_for_property_from_people(
+        self, values: set, property: str
+    ) -> list[Person]:
+        """Remove all values from property in a single pass.
+
+        List and set properties lose the matching entries, other properties are
+        set to None if they match. Returns the people that were changed.
+        """
+        values = set(values)
+        if property in self._indexes:
+            positions = set()
+            for value in values:
+                if value is not None:
+                    positions.update(self._indexes[property].get(value, set()))
+            positions = sorted(positions)
+        else:
+            positions = range(len(self.people))
+
+        people_changed = []
+        for position in positions:
+            person = self.people[position]
+            current_value = getattr(person, property)
+            if isinstance(current_value, list):
+                new_value = [x for x in current_value if x not in values]
+            elif isinstance(current_value, set):
+                new_value = {x for x in current_value if x not in values}
+            elif current_value is not None and current_value in values:
+                new_value = None
+            else:
                 continue
-            if isinstance(getattr(person, property), set):
-                setattr(
-                    person,
-                    property,
-                    {x for x in getattr(person, property) if x != value},
-                )
+            if new_value == current_value:
                 continue
-            if getattr(person, property) == value:
-                setattr(person, property, None)
+            self._set_property(position, property, new_value)
+            people_changed.append(person)
+        return people_changed
+
+
+class DatabaseQuery:
+    """Lazily evaluated conjunction of conditions on the people of a Database.
+
+    Conditions are given as property__operator=value, e.g.
+    db.query().where(category__in=JUGEND_CAT, birthday__between=(begin, end), email=None)
+    Conditions that an index can answer are intersected first, the remaining
+    ones are checked in a single pass over the candidates. between is half-open
+    (begin <= value < end) and a bound of None leaves that side open.
+    """
+
+    OPERATORS = ["eq", "ne", "in", "between", "gte", "lt", "contains"]
+
+    def __init__(self, db: Database, conditions: tuple = ()):
+        self.db = db
+        self.conditions = conditions
+        self._positions = None
+        self._version = None
+
+    def where(self, **conditions) -> "DatabaseQuery":
+        parsed = []
+        for key, value in conditions.items():
+            property, _, operator = key.partition("__")
+            operator = operator or "eq"
+            if operator not in self.OPERATORS:
+                raise ValueError(
+                    f"Unknown operator {operator} in {key}, must be one of {self.OPERATORS}"
+                )
+            if operator == "between" and len(value) != 2:
+                raise ValueError(f"{key} needs a (begin, end) tuple")
+            if operator == "in" and (
+                isinstance(value, str) or not isinstance(value, Iterable)
+            ):
+                raise ValueError(f"{key} needs a collection of values, not {value!r}")
+            parsed.append((property, operator, value))
+        return DatabaseQuery(self.db, self.conditions + tuple(parsed))
+
+    @property
+    def positions(self) -> list[int]:
+        if self._positions is None or self._version != self.db.version:
+            self._positions = self._evaluate()
+            self._version = self.db.version
+        return self._positions
+
+    @property
+    def people(self) -> list[Person]:
+        return [self.db.people[position] for position in self.positions]
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __iter__(self):
+        return iter(self.people)
+
+    def _evaluate(self) -> list[int]:
+        indexed, remaining = [], []
+        for condition in self.conditions:
+            positions = self.db._get_indexed_positions(*condition)
+            if positions is None:
+                remaining.append(condition)
+            else:
+                indexed.append(positions)
+        if len(indexed) > 0:
+            indexed.sort(key=len)
+            candidates = sorted(indexed[0].intersection(*indexed[1:]))
+        else:
+            candidates = range(len(self.db.people))
+        return [
+            position
+            for position in candidates
+            if all(
+                self._matches(self.db.people[position], *condition)
+                for condition in remaining
+            )
+        ]
+
+    @staticmethod
+    def _matches(person: Person, property: str, operator: str, value) -> bool:
+        attr = getattr(person, property, None)
+        if operator in ["eq", "ne"]:
+            if value is None:
+                equal = Database._is_missing(attr)
+            else:
+                equal = not Database._is_missing(attr) and attr == value
+            return equal if operator == "eq" else not equal
+        if operator == "contains":
+            return attr is not None and value in attr
+        if Database._is_missing(attr):
+            return False
+        if operator == "in":
+            return attr in value
+        begin, end = {
+            "between": value,
+            "gte": (value, None),
+            "lt": (None, value),
+        }[operator]
+        return (begin is None or attr >= begin) and (end is None or attr < end)
+
+
+class ColumnarDatabase(Database):
+    """Database backed by a PersonTable for vectorized filtering.
+
+    The people are still handed out as the usual Person objects, the table is
+    rebuilt lazily once per snapshot.
+    """
+
+    @property
+    def table(self) -> PersonTable:
+        if "table" not in self._snapshot_cache:
+            self._snapshot_cache["table"] = PersonTable(self.people)
+        return self._snapshot_cache["table"]
+
+    def lookup_by_property(
+        self, property: str, search_input, comparator=None
+    ) -> list[Person]:
+        if property in self._indexes and comparator in [None, np.equal]:
+            return super().lookup_by_property(property, search_input, comparator)
+        if property not in PersonTable.COLUMNS or not (
+            comparator is None or isinstance(comparator, np.ufunc)
+        ):
+            return super().lookup_by_property(property, search_input, comparator)
+        try:
+            mask = self.table.mask(property, search_input, comparator)
+        except TypeError:  # e.g. ordering comparison on a categorical column
+            return super().lookup_by_property(property, search_input, comparator)
+        return self.table.select(mask)
+
+    def lookup_by_values(self, property: str, values: list) -> list[Person]:
+        if property in self._indexes or property not in PersonTable.COLUMNS:
+            return super().lookup_by_values(property, values)
+        return self.table.select(self.table.isin(property, values))
 
 
 class MailBasedFamily:
@@ -341,6 +818,16 @@ class MailBasedFamily:
         self.people = people
         self.email = self.people[0].email
 
+    @staticmethod
+    def normalize_email(email: Optional[str]) -> Optional[str]:
+        if email is None:
+            return None
+        return email.strip().lower()
+
+    @property
+    def normalized_email(self) -> Optional[str]:
+        return self.normalize_email(self.email)
+
     def get_property_list(self, property: str) -> list:
         property_list = list(
             set([getattr(person, property, None) for person in self.people])
@@ -349,7 +836,7 @@ class MailBasedFamily:
         return property_list
 
     def __all_emails_are_equal(self, people: list[Person]):
-        email_list = [person.email for person in people]
+        email_list = [self.normalize_email(person.email) for person in people]
         return len(set(email_list)) == 1
 
     def add_person(self, new_person: Person):
@@ -359,29 +846,43 @@ class MailBasedFamily:
 
 class MailBasedDatabase:
     def __init__(self, input_file: str = None, input_db: Database = None):
-        self.mail_based_families = []
+        self._families_by_email = {}
         self.input_db = input_db
         if input_file is not None:
             self.input_db = Database(input_file)
         if self.input_db is not None:
             self.add_from_database(self.input_db)
 
+    @property
+    def mail_based_families(self) -> list[MailBasedFamily]:
+        return list(self._families_by_email.values())
+
+    @property
+    def families_by_email(self) -> dict[Optional[str], MailBasedFamily]:
+        """Families keyed by normalized email, people without email are under None."""
+        return self._families_by_email
+
     def add_from_database(self, db: Database):
         for person in db.people:
             self.add_person(person)
 
     def add_mail_based_family(self, new_mbfamily: MailBasedFamily):
-        for mbfamily in self.mail_based_families:
-            if new_mbfamily.email == mbfamily.email:
-                for person in new_mbfamily.people:
-                    mbfamily.add_person(person)
-                    return
-        self.mail_based_families.append(new_mbfamily)
+        mbfamily = self._families_by_email.get(new_mbfamily.normalized_email)
+        if mbfamily is None:
+            self._families_by_email[new_mbfamily.normalized_email] = new_mbfamily
+            return
+        for person in new_mbfamily.people:
+            mbfamily.add_person(person)
 
     def add_person(self, new_person: Person):
         self.add_mail_based_family(MailBasedFamily([new_person]))
 
     def lookup_by_property(self, property: str, search_input) -> list[MailBasedFamily]:
+        if property == "email":
+            mbfamily = self._families_by_email.get(
+                MailBasedFamily.normalize_email(search_input)
+            )
+            return [mbfamily] if mbfamily is not None else []
         mbfamilies_found = []
         for mbfamily in self.mail_based_families:
             if search_input in mbfamily.get_property_list(property):
@@ -398,19 +899,24 @@ class HouseBasedFamily:
         self.street = self.people[0].street
         self.plz = self.people[0].plz
         self.city = self.people[0].city
+        self.address_key = self.get_address_key(self.people[0])
 
     def __eq__(self, value):
-        return (
-            self.clean_steet_name(self.street) == self.clean_steet_name(value.street)
-            and self.plz == value.plz
-            and self.city == value.city
-            and self.last_name == value.last_name
-        )
+        return self.address_key == value.address_key
 
     @staticmethod
     def clean_steet_name(street: str) -> str:
         return street.lower().replace("str.", "strasse")
 
+    @staticmethod
+    def get_address_key(person: Person) -> tuple:
+        return (
+            person.last_name,
+            HouseBasedFamily.clean_steet_name(person.street),
+            person.plz,
+            person.city,
+        )
+
     def get_property_list(self, property: str) -> list:
         property_list = list(
             set([getattr(person, property, None) for person in self.people])
@@ -419,33 +925,33 @@ class HouseBasedFamily:
         return property_list
 
     def __all_properties_match(self, people: list[Person]):
-        address_list = [
-            (
-                person.last_name,
-                self.clean_steet_name(person.street),
-                person.plz,
-                person.city,
-            )
-            for person in people
-        ]
+        address_list = [self.get_address_key(person) for person in people]
         return len(set(address_list)) == 1
 
     def add_person(self, new_person: Person, ignore_properties_check: bool = False):
         if not ignore_properties_check:
-            assert self.__all_properties_match(self.people + [new_person])
+            assert self.get_address_key(new_person) == self.address_key
         self.people.append(new_person)
 
 
 class HouseBasedDatabase:
-    def __init__(self, input_file: str = None, input_db: Database = None):
-        self.house_based_families = []
+    def __init__(
+        self, input_file: str = None, input_db: Database | DatabaseQuery = None
+    ):
+        self._families_by_address = {}
+        self._merged_addresses = {}  # address key of a merged family -> survivor
+        self._family_by_member_number = {}
         self.input_db = input_db
         if input_file is not None:
             self.input_db = Database(input_file)
         if self.input_db is not None:
             self.add_from_database(self.input_db)
 
-    def add_from_database(self, db: Database):
+    @property
+    def house_based_families(self) -> list[HouseBasedFamily]:
+        return list(self._families_by_address.values())
+
+    def add_from_database(self, db: Database | DatabaseQuery):
         for person in db.people:
             self.add_person(person)
 
@@ -453,12 +959,19 @@ class HouseBasedDatabase:
         self.add_house_based_family(HouseBasedFamily([new_person]))
 
     def add_house_based_family(self, new_hbfamily: HouseBasedFamily):
-        for hbfamily in self.house_based_families:
-            if new_hbfamily == hbfamily:
-                for person in new_hbfamily.people:
-                    hbfamily.add_person(person)
-                    return
-        self.house_based_families.append(new_hbfamily)
+        address_key = new_hbfamily.address_key
+        while address_key in self._merged_addresses:
+            address_key = self._merged_addresses[address_key]
+        hbfamily = self._families_by_address.get(address_key)
+        if hbfamily is None:
+            self._families_by_address[address_key] = new_hbfamily
+            hbfamily = new_hbfamily
+        else:
+            for person in new_hbfamily.people:
+                hbfamily.add_person(person, ignore_properties_check=True)
+        for person in new_hbfamily.people:
+            if person.member_number is not None:
+                self._family_by_member_number[person.member_number] = hbfamily
 
     def lookup_by_property(self, property: str, search_input) -> list[HouseBasedFamily]:
         hbfamilies_found = []
@@ -469,18 +982,41 @@ class HouseBasedDatabase:
 
     def combine_housemates(self, housemates_file: str):
         grouped_member_numbers = self.load_grouped_member_numbers(housemates_file)
+        # union-find over the address keys of the families, the first family
+        # found for a group becomes the root all others get merged into
+        parent = {}
+
+        def find(address_key: tuple) -> tuple:
+            root = address_key
+            while parent.get(root, root) != root:
+                root = parent[root]
+            while address_key != root:
+                parent[address_key], address_key = root, parent[address_key]
+            return root
+
         for group in grouped_member_numbers:
-            families_to_merge = []
-            for member_number in group:
-                for hb_family in self.house_based_families:
-                    family_member_numbers = [
-                        person.member_number for person in hb_family.people
-                    ]
-                    if member_number in family_member_numbers:
-                        families_to_merge.append(hb_family)
-                        break
-            if len(families_to_merge) > 1:
-                self._force_merge_house_based_families(families_to_merge)
+            address_keys = [
+                self._family_by_member_number[member_number].address_key
+                for member_number in group
+                if member_number in self._family_by_member_number
+            ]
+            for address_key in address_keys[1:]:
+                root, other_root = find(address_keys[0]), find(address_key)
+                if root != other_root:
+                    parent[other_root] = root
+
+        address_keys_to_merge = {}
+        for address_key in parent:
+            address_keys_to_merge.setdefault(find(address_key), []).append(address_key)
+        for root, address_keys in address_keys_to_merge.items():
+            self._force_merge_house_based_families(
+                [self._families_by_address[root]]
+                + [
+                    self._families_by_address[address_key]
+                    for address_key in address_keys
+                    if address_key != root
+                ]
+            )
 
     def _force_merge_house_based_families(
         self, families_to_merge: list[HouseBasedFamily]
@@ -491,7 +1027,10 @@ class HouseBasedDatabase:
         for family in families_to_merge[1:]:
             for person in family.people:
                 first_family.add_person(person, ignore_properties_check=True)
-            self.house_based_families.remove(family)
+                if person.member_number is not None:
+                    self._family_by_member_number[person.member_number] = first_family
+            del self._families_by_address[family.address_key]
+            self._merged_addresses[family.address_key] = first_family.address_key
 
     def load_grouped_member_numbers(self, housemates_file: str) -> list[list[int]]:
         if housemates_file is None:
@@ -0,0 +1,65 @@
+import os
+import json
+import hashlib
+import logging
+import pandas as pd
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "export_manifest.json"
+
+
+class ExportManifest:
+    """Content hashes of the exported files in an output folder."""
+
+    def __init__(self, folder: str):
+        self.folder = Path(folder)
+        self.filename = self.folder / MANIFEST_FILENAME
+        self.entries = self._load()
+
+    @staticmethod
+    def get_content_hash(df: pd.DataFrame, writer: str, index: bool = False) -> str:
+        digest = hashlib.sha256(writer.encode())
+        digest.update(json.dumps([str(column) for column in df.columns]).encode())
+        digest.update(pd.util.hash_pandas_object(df, index=index).to_numpy().tobytes())
+        return digest.hexdigest()
+
+    def has_file(self, name: str, content_hash: str) -> bool:
+        """Whether a file with this content was recorded and still exists."""
+        entry = self.entries.get(name)
+        if entry is None or entry["hash"] != content_hash:
+            return False
+        return (self.folder / entry["filename"]).is_file()
+
+    def is_unchanged(self, name: str, content_hash: str, filename: str) -> bool:
+        if not self.has_file(name, content_hash):
+            return False
+        old_filename = self.folder / self.entries[name]["filename"]
+        if old_filename != Path(filename):
+            os.replace(old_filename, filename)
+            self.record(name, content_hash, filename)
+            logger.info(f"{name} is unchanged, renamed {old_filename} to {filename}")
+        return True
+
+    def record(self, name: str, content_hash: str, filename: str):
+        self.entries[name] = {
+            "hash": content_hash,
+            "filename": os.path.relpath(filename, self.folder),
+            "updated": pd.Timestamp.now().isoformat(timespec="seconds"),
+        }
+
+    def save(self):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        with open(self.filename, "w", encoding="utf8") as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+
+    def _load(self) -> dict[str, dict]:
+        if not self.filename.is_file():
+            return {}
+        try:
+            with open(self.filename, encoding="utf8") as f:
+                return json.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load export manifest {self.filename}: {e}")
+            return {}
@@ -0,0 +1,140 @@
+import time
+import logging
+import pandas as pd
+from dataclasses import dataclass
+from typing import Any, Callable, NamedTuple, Optional
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from src.utils.export_manifest import ExportManifest
+from src.utils.writers import write_df
+
+logger = logging.getLogger(__name__)
+
+EXECUTORS = {
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+}
+
+
+@dataclass
+class ExportJob:
+    name: str
+    filename: str
+    function: Callable[..., Any]  # must be a module level function for "process"
+    args: tuple = ()
+    content_hash: Optional[str] = None  # skip the job if the manifest has it
+
+
+class BuiltExport(NamedTuple):
+    """Returned by job functions that compute the content hash themselves."""
+
+    content_hash: str
+    changed: bool
+
+
+@dataclass
+class ExportResult:
+    name: str
+    filename: str
+    duration: float
+    error: Optional[str] = None
+    changed: bool = True
+    content_hash: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.error is None
+
+
+def run_export_jobs(
+    jobs: list[ExportJob],
+    max_workers: Optional[int] = None,
+    executor: str = "thread",
+    manifest: Optional[ExportManifest] = None,
+) -> list[ExportResult]:
+    """Run the jobs concurrently and return one result per job, in job order."""
+    if executor not in EXECUTORS:
+        raise ValueError(f"executor must be one of {list(EXECUTORS.keys())}")
+    if len(jobs) == 0:
+        return []
+    start = time.perf_counter()
+    results = {}
+    jobs_to_run = []
+    for idx, job in enumerate(jobs):
+        if (
+            manifest is not None
+            and job.content_hash is not None
+            and manifest.is_unchanged(job.name, job.content_hash, job.filename)
+        ):
+            results[idx] = ExportResult(job.name, job.filename, 0.0, changed=False)
+        else:
+            jobs_to_run.append((idx, job))
+
+    if len(jobs_to_run) > 0:
+        with EXECUTORS[executor](max_workers=max_workers) as pool:
+            futures = {
+                idx: pool.submit(
+                    _run_export_job, job.name, job.filename, job.function, job.args
+                )
+                for idx, job in jobs_to_run
+            }
+            for idx, future in futures.items():
+                results[idx] = future.result()
+
+    for idx, job in jobs_to_run:
+        result = results[idx]
+        content_hash = job.content_hash or result.content_hash
+        if result.success and not result.changed:
+            manifest.is_unchanged(job.name, content_hash, job.filename)
+        elif result.success:
+            logger.info(f"Exported {result.name} in {result.duration:.3f}s")
+            if manifest is not None and content_hash is not None:
+                manifest.record(job.name, content_hash, job.filename)
+        else:
+            logger.error(f"Failed to export {result.name}: {result.error}")
+    if manifest is not None:
+        manifest.save()
+
+    results = [results[idx] for idx in range(len(jobs))]
+    attempted = [result for result in results if result.changed]
+    written = [result for result in attempted if result.success]
+    logger.info(
+        f"Exported {len(written)}/{len(attempted)} changed files in {time.perf_counter() - start:.3f}s using {executor} pool, {len(results) - len(attempted)} unchanged"
+    )
+    return results
+
+
+def _run_export_job(
+    name: str, filename: str, function: Callable[..., Any], args: tuple
+) -> ExportResult:
+    start = time.perf_counter()
+    try:
+        output = function(*args)
+    except Exception as e:
+        return ExportResult(name, filename, time.perf_counter() - start, repr(e))
+    if isinstance(output, BuiltExport):
+        return ExportResult(
+            name,
+            filename,
+            time.perf_counter() - start,
+            changed=output.changed,
+            content_hash=output.content_hash,
+        )
+    return ExportResult(name, filename, time.perf_counter() - start)
+
+
+def build_and_write_df(
+    name: str,
+    filename: str,
+    build: Callable[..., pd.DataFrame],
+    build_args: tuple,
+    writer: str = "xlsx",
+    index: bool = False,
+    manifest: Optional[ExportManifest] = None,
+) -> BuiltExport:
+    """Build and hash a DataFrame in the worker, write it unless it is unchanged."""
+    df = build(*build_args)
+    content_hash = ExportManifest.get_content_hash(df, writer, index)
+    if manifest is not None and manifest.has_file(name, content_hash):
+        return BuiltExport(content_hash, changed=False)
+    write_df(df, filename, writer, index)
+    return BuiltExport(content_hash, changed=True)
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+from src import ADULT_CAT, JUGEND_CAT
+from src.utils.databases import Person, PersonTable
+
+
+class GVCohorts:
+    """Adults bucketed by join year and youth bucketed by birth year.
+
+    The buckets are built once from the columns of a PersonTable, every list
+    for the GV is then just a union of buckets. The lists are grouped by
+    category (in the order of ADULT_CAT / JUGEND_CAT) and in database order
+    within a category.
+    """
+
+    def __init__(self, table: PersonTable):
+        self.people = table.people
+        self.adult_rank = self._get_category_rank(table, ADULT_CAT)
+        self.youth_rank = self._get_category_rank(table, JUGEND_CAT)
+        self.adults_by_join_year = self._bucket_positions(
+            table.isin("category", ADULT_CAT), table.df["date_added"]
+        )
+        self.youth_by_birth_year = self._bucket_positions(
+            table.isin("category", JUGEND_CAT), table.df["birthday"]
+        )
+
+    def adults_joined(
+        self, begin: Optional[int] = None, end: Optional[int] = None
+    ) -> list[Person]:
+        """Adults that joined in a year with begin <= year < end."""
+        return self._select(self.adults_by_join_year, self.adult_rank, begin, end)
+
+    def youth_born(
+        self, begin: Optional[int] = None, end: Optional[int] = None
+    ) -> list[Person]:
+        """Youth born in a year with begin <= year < end."""
+        return self._select(self.youth_by_birth_year, self.youth_rank, begin, end)
+
+    def _select(
+        self,
+        buckets: dict[int, np.ndarray],
+        category_rank: np.ndarray,
+        begin: Optional[int],
+        end: Optional[int],
+    ) -> list[Person]:
+        positions = [
+            bucket
+            for year, bucket in buckets.items()
+            if (begin is None or year >= begin) and (end is None or year < end)
+        ]
+        if len(positions) == 0:
+            return []
+        positions = np.concatenate(positions)
+        order = np.lexsort((positions, category_rank[positions]))
+        return [self.people[position] for position in positions[order]]
+
+    @staticmethod
+    def _get_category_rank(table: PersonTable, categories: list[str]) -> np.ndarray:
+        rank = {category: idx for idx, category in enumerate(categories)}
+        return np.array(
+            [rank.get(category, len(rank)) for category in table.df["category"]]
+        )
+
+    @staticmethod
+    def _bucket_positions(mask: np.ndarray, dates: pd.Series) -> dict[int, np.ndarray]:
+        positions = np.flatnonzero(mask & dates.notna().to_numpy())
+        years = dates.dt.year.to_numpy()[positions].astype(int)
+        order = np.argsort(years, kind="stable")
+        years, positions = years[order], positions[order]
+        unique_years, starts = np.unique(years, return_index=True)
+        return dict(zip(unique_years.tolist(), np.split(positions, starts[1:])))
@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Optional
+from src import ADULT_CAT, NOT_ACTIVE_ERW_CAT, MALE
+from src.utils.databases import PersonTable
+
+AGE_BUCKETS = [0, 7, 12, 17, 20, 30, 40, 50, 60, 70, 80]
+
+
+@dataclass
+class MemberStatistics:
+    num_total: int = 0
+    num_of_erw: int = 0
+    num_of_men: int = 0
+    num_of_active_men: int = 0
+    num_of_passive_or_nturnend_men: int = 0
+    num_of_women: int = 0
+    num_of_active_women: int = 0
+    num_of_passive_or_nturnend_women: int = 0
+    num_of_kids: int = 0
+    num_of_boys: int = 0
+    num_of_girls: int = 0
+    max_age: int = 0
+    min_age: float = np.inf
+    per_category: dict[str, int] = field(default_factory=dict)
+    per_riege: dict[str, int] = field(default_factory=dict)
+    per_age_bucket: dict[str, int] = field(default_factory=dict)
+
+    def to_markdown(self) -> str:
+        return f"""
+
+
+            **Total Number of Members:** {str(self.num_total)}  
+
+            **Number of Adults:** {str(self.num_of_erw)}  
+            Men: {str(self.num_of_men)}  
+            active Men: {str(self.num_of_active_men)}  
+            passive or non-active Men: {str(self.num_of_passive_or_nturnend_men)}  
+            Women: {str(self.num_of_women)}  
+            active Women: {str(self.num_of_active_women)}  
+            passive or non-active Women: {str(self.num_of_passive_or_nturnend_women)}  
+                
+            **Number of Children:** {str(self.num_of_kids)}  
+                Boys: {str(self.num_of_boys)}  
+                Girls: {str(self.num_of_girls)}  
+
+
+            **Oldest Member:** {str(self.max_age)} years old  
+            **Youngest Member:** {str(self.min_age)} years old
+            """
+
+
+def get_age_bucket_labels(buckets: list[int] = AGE_BUCKETS) -> list[str]:
+    labels = [f"{begin}-{end - 1}" for begin, end in zip(buckets[:-1], buckets[1:])]
+    return labels + [f"{buckets[-1]}+"]
+
+
+def compute_statistics(
+    table: PersonTable, base_member_tag: str, ts: Optional[pd.Timestamp] = None
+) -> MemberStatistics:
+    """Compute all member statistics from the columns of table in one go.
+
+    Only people tagged with base_member_tag are counted.
+    """
+    base_member = table.has_tag(base_member_tag)
+    adult = base_member & table.isin("category", ADULT_CAT)
+    kid = base_member & ~adult
+    male = table.mask("gender", MALE)
+    not_active = table.isin("category", NOT_ACTIVE_ERW_CAT)
+    ages = table.ages(ts)[base_member].dropna()
+
+    stats = MemberStatistics()
+    stats.num_total = int(base_member.sum())
+    stats.num_of_erw = int(adult.sum())
+    stats.num_of_men = int((adult & male).sum())
+    stats.num_of_women = stats.num_of_erw - stats.num_of_men
+    stats.num_of_passive_or_nturnend_men = int((adult & male & not_active).sum())
+    stats.num_of_active_men = stats.num_of_men - stats.num_of_passive_or_nturnend_men
+    stats.num_of_passive_or_nturnend_women = int((adult & ~male & not_active).sum())
+    stats.num_of_active_women = (
+        stats.num_of_women - stats.num_of_passive_or_nturnend_women
+    )
+    stats.num_of_kids = int(kid.sum())
+    stats.num_of_boys = int((kid & male).sum())
+    stats.num_of_girls = stats.num_of_kids - stats.num_of_boys
+    if len(ages) > 0:
+        stats.max_age = int(ages.max())
+        stats.min_age = int(ages.min())
+
+    categories = table.df["category"][base_member].value_counts(sort=False)
+    stats.per_category = {
+        category: int(count) for category, count in categories.items() if count > 0
+    }
+    stats.per_riege = dict(
+        Counter(
+            riege
+            for person in table.select(base_member)
+            for riege in set(person.riegen_member + person.riegen_coach)
+        )
+    )
+    age_buckets = pd.cut(
+        ages.astype(int),
+        bins=AGE_BUCKETS + [np.inf],
+        labels=get_age_bucket_labels(),
+        right=False,
+    ).value_counts(sort=False)
+    stats.per_age_bucket = {bucket: int(count) for bucket, count in age_buckets.items()}
+    return stats
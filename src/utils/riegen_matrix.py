@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+from typing import Optional
+from src.utils.databases import Person
+
+ROLES = ["all", "members", "coaches"]
+
+
+def get_person_riegen(person: Person, role: str = "all") -> list[str]:
+    if role == "members":
+        return person.riegen_member
+    if role == "coaches":
+        return person.riegen_coach
+    if role == "all":
+        return person.riegen_member + person.riegen_coach
+    raise ValueError(f"role must be one of {ROLES}")
+
+
+def get_incidence_matrix(
+    people: list[Person], riegen: list[str], role: str = "all"
+) -> np.ndarray:
+    """Boolean person x riege matrix, True where people[i] is in riegen[j].
+
+    Riegen of a person that are not in riegen are ignored.
+    """
+    column_of_riege = {riege: column for column, riege in enumerate(riegen)}
+    rows, columns = [], []
+    for row, person in enumerate(people):
+        for riege in get_person_riegen(person, role):
+            column = column_of_riege.get(riege)
+            if column is not None:
+                rows.append(row)
+                columns.append(column)
+    incidence = np.zeros((len(people), len(riegen)), dtype=bool)
+    incidence[rows, columns] = True
+    return incidence
+
+
+def get_overlap_matrix(
+    people: list[Person],
+    riegen: list[str],
+    role: str = "all",
+    comparison_role: Optional[str] = None,
+    jaccard: bool = False,
+) -> pd.DataFrame:
+    """Number of people that are in both the row and the column riege.
+
+    Rows count people in the riege with the given role, columns with
+    comparison_role (defaults to role), e.g. role="coaches" and
+    comparison_role="members" counts the coaches of the row riege that are
+    members of the column riege. With jaccard the counts are divided by the
+    number of people in either riege.
+    """
+    comparison_role = comparison_role or role
+    incidence = get_incidence_matrix(people, riegen, role).astype(np.int64)
+    if comparison_role == role:
+        comparison_incidence = incidence
+    else:
+        comparison_incidence = get_incidence_matrix(
+            people, riegen, comparison_role
+        ).astype(np.int64)
+
+    overlap = incidence.T @ comparison_incidence
+    if jaccard:
+        sizes = incidence.sum(axis=0)
+        comparison_sizes = comparison_incidence.sum(axis=0)
+        union = sizes[:, np.newaxis] + comparison_sizes[np.newaxis, :] - overlap
+        overlap = np.divide(
+            overlap,
+            union,
+            out=np.zeros(overlap.shape, dtype=float),
+            where=union > 0,
+        )
+    return pd.DataFrame(overlap, index=list(riegen), columns=list(riegen))
@@ -0,0 +1,79 @@
+import os
+import glob
+import time
+import pickle
+import hashlib
+import logging
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+TRANSLATOR_FILES = sorted(glob.glob("src/utils/*.json"))
+CACHE_FORMAT_VERSION = 2  # increase whenever the pickled classes change
+
+
+class SnapshotCache:
+    """Pickles of objects keyed by the content hashes of their input files."""
+
+    def __init__(self, folder: str):
+        self.folder = Path(folder)
+
+    def get_or_create(
+        self, name: str, input_files: list[Optional[str]], create: Callable[[], Any]
+    ) -> Any:
+        start = time.perf_counter()
+        key = self.get_key(input_files + TRANSLATOR_FILES)
+        cached = self.load(name, key)
+        if cached is not None:
+            logger.info(
+                f"Snapshot cache hit for {name} ({key[:12]}), loaded in {time.perf_counter() - start:.3f}s"
+            )
+            return cached
+
+        logger.info(f"Snapshot cache miss for {name} ({key[:12]}), building it")
+        obj = create()
+        build_time = time.perf_counter() - start
+        self.store(name, key, obj)
+        logger.info(
+            f"Built {name} in {build_time:.3f}s, stored in snapshot cache in {time.perf_counter() - start - build_time:.3f}s"
+        )
+        return obj
+
+    @staticmethod
+    def get_key(input_files: list[Optional[str]]) -> str:
+        digest = hashlib.sha256(f"version {CACHE_FORMAT_VERSION}".encode())
+        for input_file in input_files:
+            if input_file is None or not os.path.isfile(input_file):
+                digest.update(b"missing")
+                continue
+            with open(input_file, "rb") as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        return digest.hexdigest()
+
+    def load(self, name: str, key: str) -> Optional[Any]:
+        filename = self._get_filename(name, key)
+        if not filename.is_file():
+            return None
+        try:
+            with open(filename, "rb") as f:
+                return pickle.load(f)
+        except Exception as e:
+            logger.warning(f"Could not load snapshot cache {filename}: {e}")
+            return None
+
+    def store(self, name: str, key: str, obj: Any):
+        self.folder.mkdir(parents=True, exist_ok=True)
+        self.clear(name)
+        filename = self._get_filename(name, key)
+        with open(filename, "wb") as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def clear(self, name: Optional[str] = None):
+        """Remove the stored entries of name, or all entries if name is None."""
+        pattern = f"{name}_*.pkl" if name else "*.pkl"
+        for filename in self.folder.glob(pattern):
+            filename.unlink()
+
+    def _get_filename(self, name: str, key: str) -> Path:
+        return self.folder / f"{name}_{key}.pkl"
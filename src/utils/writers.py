@@ -0,0 +1,101 @@
+import csv
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from typing import Any, Iterable, Sequence, Union
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+
+
+class TableWriter(ABC):
+    """Writes a header and a stream of rows to a file, one row at a time."""
+
+    suffix = ""
+
+    @abstractmethod
+    def write(self, filename: str, columns: list[str], rows: Iterable[Sequence]):
+        pass
+
+    def get_filename(self, filename: str) -> str:
+        path = Path(filename)
+        if path.suffix in [writer.suffix for writer in WRITERS.values()]:
+            return str(path.with_suffix(self.suffix))
+        return str(path.with_name(path.name + self.suffix))
+
+    @staticmethod
+    def clean_value(value: Any) -> Any:
+        if isinstance(value, (list, set, tuple, dict)):
+            return value
+        if pd.isna(value):
+            return None
+        if isinstance(value, np.generic):
+            return value.item()
+        return value
+
+
+class CsvTableWriter(TableWriter):
+    suffix = ".csv"
+
+    def write(self, filename: str, columns: list[str], rows: Iterable[Sequence]):
+        with open(filename, "w", newline="", encoding="utf8") as f:
+            csv_writer = csv.writer(f)
+            csv_writer.writerow(columns)
+            for row in rows:
+                csv_writer.writerow([self.clean_value(value) for value in row])
+
+
+class XlsxTableWriter(TableWriter):
+    """Streams rows into a write-only openpyxl workbook (constant memory)."""
+
+    suffix = ".xlsx"
+
+    def write(self, filename: str, columns: list[str], rows: Iterable[Sequence]):
+        workbook = Workbook(write_only=True)
+        worksheet = workbook.create_sheet()
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(worksheet, value=column)
+            cell.font = Font(bold=True)
+            header.append(cell)
+        worksheet.append(header)
+        for row in rows:
+            worksheet.append([self.clean_value(value) for value in row])
+        workbook.save(filename)
+
+
+WRITERS = {
+    "xlsx": XlsxTableWriter,
+    "csv": CsvTableWriter,
+}
+
+
+def get_writer(writer: Union[str, TableWriter]) -> TableWriter:
+    if isinstance(writer, TableWriter):
+        return writer
+    if writer not in WRITERS:
+        raise ValueError(f"writer must be one of {list(WRITERS.keys())}")
+    return WRITERS[writer]()
+
+
+def write_df(
+    df: pd.DataFrame,
+    filename: str,
+    writer: Union[str, TableWriter] = "xlsx",
+    index: bool = False,
+) -> str:
+    """Write df with the given writer and return the filename actually used.
+
+    The file ending is replaced to match the writer, e.g. "list.xlsx" becomes
+    "list.csv" when written with the csv writer.
+    """
+    writer = get_writer(writer)
+    filename = writer.get_filename(filename)
+    Path(filename).parent.mkdir(parents=True, exist_ok=True)
+    columns = [str(column) for column in df.columns]
+    rows = df.itertuples(index=index, name=None)
+    if index:
+        columns = [df.index.name or ""] + columns
+    writer.write(filename, columns, rows)
+    return filename
@@ -0,0 +1,59 @@
+import os
+import shutil
+import tempfile
+import pandas as pd
+from unittest import TestCase
+from unittest.mock import patch
+from src.STVAdmin_export_client import (
+    CACHE_FOLDER,
+    FILENAME_ADDITIONAL_PEOPLE,
+    STVAdminExportClient,
+)
+from src.utils.databases import ColumnarDatabase
+
+
+class TestSTVAdminExportClient(TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        pd.DataFrame({"Vorname": ["vorname5"]}).to_excel(
+            os.path.join(self.folder, FILENAME_ADDITIONAL_PEOPLE), index=False
+        )
+        self.patches = [
+            patch("src.STVAdmin_export_client.CleverreachClient"),
+            patch("src.STVAdmin_export_client.FILENAME_BACKUP_LIST", None),
+            patch("src.STVAdmin_export_client.FILENAME_REMOVE_LIST", None),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.folder)
+
+    def get_client(self) -> STVAdminExportClient:
+        # like a fresh download, the client deletes the lists when it is dropped
+        shutil.copy("tests/data/test_database.csv", self.folder)
+        shutil.copy("tests/data/test_riegenlist.csv", self.folder)
+        client = STVAdminExportClient(path=self.folder)
+        client._userlist_filename = "test_database.csv"
+        client._riegenlist_filename = "test_riegenlist.csv"
+        return client
+
+    def test_main_db_snapshot_cache(self):
+        with patch(
+            "src.STVAdmin_export_client.ColumnarDatabase", side_effect=ColumnarDatabase
+        ) as load_main_db:
+            client = self.get_client()
+            self.assertEqual(len(client.main_db.people), 5)
+            del client
+            self.assertFalse(
+                os.path.isfile(os.path.join(self.folder, "test_database.csv"))
+            )
+
+            client = self.get_client()
+            self.assertEqual(len(client.main_db.people), 5)
+            self.assertEqual(load_main_db.call_count, 1)
+
+            client.clear_snapshot_cache()
+            self.assertEqual(os.listdir(os.path.join(self.folder, CACHE_FOLDER)), [])
@@ -0,0 +1,31 @@
+from unittest import TestCase
+from src.utils.adress_databases import AdressDatabase, HouseBasedAdressDatabase
+from src.utils.databases import Database, HouseBasedDatabase
+
+
+class TestAdressDatabase(TestCase):
+    def test_load_adress_database_excel(self):
+        file = "tests/data/test_database.xlsx"
+        ad_db = AdressDatabase(file)
+        self.assertEqual(len(ad_db.df), 4)
+        self.assertEqual(list(ad_db.df.columns), ad_db.columns)
+        self.assertEqual(
+            list(ad_db.df["Anrede"]), ["Lieber", "Liebe", "Lieber", "Liebe"]
+        )
+        self.assertEqual(list(ad_db.df["Email"]), ["email1", "email3", "email3", None])
+
+    def test_empty_adress_database(self):
+        ad_db = AdressDatabase(input_db=Database())
+        self.assertEqual(len(ad_db.df), 0)
+        self.assertEqual(list(ad_db.df.columns), ad_db.columns)
+
+    def test_house_based_adress_database(self):
+        file = "tests/data/test_database.xlsx"
+        hb_db = HouseBasedDatabase(file)
+        hb_db.combine_housemates("tests/data/test_housemates.xlsx")
+        hb_ad_db = HouseBasedAdressDatabase(hb_db)
+        self.assertEqual(
+            list(hb_ad_db.df["Name"]),
+            ["vorname4 nachname4", "Fam. nachname1 & nachname2 & nachname3"],
+        )
+        self.assertEqual(list(hb_ad_db.df["PLZ"]), ["1234", "5436"])
@@ -0,0 +1,139 @@
+import time
+from unittest import TestCase
+from unittest.mock import patch
+from src.utils.cleverreach_client import CleverreachClient
+
+
+class FakeResponse:
+    def __init__(self, data, status_code: int = 200):
+        self.data = data
+        self.status_code = status_code
+        self.text = str(data)
+
+    def json(self):
+        return self.data
+
+
+class FakeSession:
+    """Records the requests and answers them with handler(method, url, kwargs)."""
+
+    def __init__(self, handler):
+        self.handler = handler
+        self.headers = {}
+        self.requests = []
+
+    def request(self, method: str, url: str, **kwargs) -> FakeResponse:
+        self.requests.append((method, url, kwargs, dict(self.headers)))
+        return self.handler(method, url, kwargs)
+
+    def post(self, url: str, **kwargs) -> FakeResponse:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        pass
+
+
+def get_client(handler) -> CleverreachClient:
+    with patch("src.utils.cleverreach_client.CredentialsBase"):
+        client = CleverreachClient()
+    client.session = FakeSession(handler)
+    return client
+
+
+class TestCleverreachClient(TestCase):
+    def test_token_is_attached_to_session_once(self):
+        def handler(method, url, kwargs):
+            if url == CleverreachClient._TOKEN_URL:
+                return FakeResponse({"access_token": "token", "expires_in": 3600})
+            return FakeResponse([])
+
+        client = get_client(handler)
+        client.get_attributes()
+        client.get_attributes()
+        urls = [url for _, url, _, _ in client.session.requests]
+        self.assertEqual(urls.count(CleverreachClient._TOKEN_URL), 1)
+        self.assertEqual(client.session.headers["Authorization"], "Bearer token")
+
+        client._token_expiry = time.time()
+        client.get_attributes()
+        urls = [url for _, url, _, _ in client.session.requests]
+        self.assertEqual(urls.count(CleverreachClient._TOKEN_URL), 2)
+
+    def test_update_receivers_for_group_in_chunks(self):
+        attempts = []
+
+        def handler(method, url, kwargs):
+            if url == CleverreachClient._TOKEN_URL:
+                return FakeResponse({"access_token": "token", "expires_in": 3600})
+            chunk = kwargs["json"]
+            attempts.append(chunk[0]["email"])
+            if chunk[0]["email"] == "email3" and attempts.count("email3") == 1:
+                return FakeResponse("server error", status_code=500)
+            return FakeResponse(
+                [
+                    {"status": "invalid" if r["email"] == "bad" else "update success"}
+                    for r in chunk
+                ]
+            )
+
+        client = get_client(handler)
+        receivers = [
+            {"email": email} for email in ["email1", "bad", "email3", "email4"]
+        ]
+        with patch("src.utils.cleverreach_client.time.sleep"):
+            result = client.update_receivers_for_group(
+                group_id=1, receivers=receivers, chunk_size=2
+            )
+        self.assertEqual(result.total, 4)
+        self.assertFalse(result.success)
+        self.assertEqual(result.failed_emails, ["bad"])
+        self.assertEqual(sorted(attempts), ["email1", "email3", "email3"])
+
+    def test_get_receivers_for_group_complete(self):
+        all_receivers = [{"id": idx} for idx in range(12)]
+
+        def get_handler(total_count: int, default_pagesize: int):
+            # like the API: the offset follows the requested page size, but a
+            # page never holds more than the default page size
+            def handler(method, url, kwargs):
+                if url == CleverreachClient._TOKEN_URL:
+                    return FakeResponse({"access_token": "token", "expires_in": 3600})
+                if url.endswith("/stats"):
+                    return FakeResponse({"total_count": total_count})
+                params = kwargs["params"]
+                pagesize = params.get("pagesize", default_pagesize)
+                start = params["page"] * pagesize
+                return FakeResponse(
+                    all_receivers[start : start + min(pagesize, default_pagesize)]
+                )
+
+            return handler
+
+        for total_count, default_pagesize in [(12, 100), (12, 5), (12, 4), (20, 5)]:
+            client = get_client(get_handler(total_count, default_pagesize))
+            receivers = client.get_receivers_for_group_complete(group_id=1)
+            self.assertEqual(receivers, all_receivers)
+
+        client = get_client(get_handler(12, 2))
+        receivers = client.get_receivers_for_group_filtered_complete(
+            group_id=1, filter_id=2
+        )
+        self.assertEqual(receivers, all_receivers)
+
+        client = get_client(get_handler(0, 5))
+        self.assertEqual(client.get_receivers_for_group_complete(group_id=1), [])
+
+    def test_activate_receivers(self):
+        def handler(method, url, kwargs):
+            if url == CleverreachClient._TOKEN_URL:
+                return FakeResponse({"access_token": "token", "expires_in": 3600})
+            if "/receivers/2/" in url:
+                return FakeResponse("not found", status_code=404)
+            return FakeResponse(True)
+
+        client = get_client(handler)
+        results = client.activate_receivers(
+            group_id=1, receiver_ids=[1, 2, 3], requests_per_second=1000
+        )
+        self.assertEqual([result.receiver_id for result in results], [1, 2, 3])
+        self.assertEqual([result.success for result in results], [True, False, True])
@@ -24,3 +24,25 @@ class TestCleverreachDatabase(TestCase):
                     for val in expected_df[col].values
                 ]
             np.testing.assert_array_equal(expected_df[col].values, cr_db.df[col].values)
+
+    def test_to_receivers_delta(self):
+        cr_db = CleverreachDatabase("tests/data/test_database.xlsx")
+        receivers = cr_db.to_receivers()
+        current_receivers = [
+            {
+                "email": receiver["email"].upper(),
+                "global_attributes": dict(receiver["global_attributes"], updated="old"),
+            }
+            for receiver in receivers[:2]
+        ]
+        current_receivers[1]["global_attributes"]["firstname"] = "changed"
+
+        delta = cr_db.to_receivers_delta(current_receivers)
+        self.assertEqual(
+            [receiver["email"] for receiver in delta], cr_db.df["Email"].tolist()
+        )
+        self.assertEqual(
+            delta[0]["global_attributes"],
+            {"updated": receivers[0]["global_attributes"]["updated"]},
+        )
+        self.assertEqual(delta[1:], receivers[1:])
@@ -1,7 +1,7 @@
 import pandas as pd
 import numpy as np
 from unittest import TestCase
-from src.utils.databases import Database, Person
+from src.utils.databases import ColumnarDatabase, Database, Person
 
 
 class TestDatabase(TestCase):
@@ -41,3 +41,173 @@ class TestDatabase(TestCase):
             property="email", removelist=[person_to_remove]
         )
         self.assertEqual(len(db.lookup_by_property("email", None)), 2)
+
+    def test_lookup_by_indexed_property(self):
+        file = "tests/data/test_database.xlsx"
+        db = Database(file)
+        self.assertEqual(len(db.lookup_by_property("member_number", 456)), 1)
+        self.assertEqual(len(db.lookup_by_property("category", "Aktive Turner")), 3)
+        self.assertEqual(len(db.lookup_by_property("emails", "email2")), 1)
+        self.assertEqual(len(db.lookup_by_property("email", "email3")), 2)
+
+        db.remove_value_for_property_from_people(value="email3", property="email")
+        self.assertEqual(len(db.lookup_by_property("email", "email3")), 0)
+        self.assertEqual(len(db.lookup_by_property("email", None)), 3)
+
+        db.add_people([Person(member_number=1, emails=["email3"])])
+        self.assertEqual(len(db.lookup_by_property("email", "email3")), 1)
+        self.assertEqual(len(db.lookup_by_property("member_number", 1)), 1)
+
+    def test_lookup_range(self):
+        file = "tests/data/test_database.xlsx"
+        db = Database(file)
+        people_found = db.lookup_range(
+            "birthday", begin=pd.Timestamp("1999-01-01"), end=pd.Timestamp("2000-01-01")
+        )
+        self.assertEqual([person.first_name for person in people_found], ["vorname1"])
+
+        people_found = db.lookup_range("birthday", end=pd.Timestamp("1999-01-01"))
+        self.assertEqual(len(people_found), 2)
+
+        db.add_people([Person(first_name="vorname5", birthday="1999-06-06")])
+        people_found = db.lookup_range("birthday", begin=pd.Timestamp("1999-01-01"))
+        self.assertEqual(len(people_found), 3)
+
+    def test_query(self):
+        file = "tests/data/test_database.xlsx"
+        db = Database(file)
+        query = db.query().where(
+            category__in=["Aktive Turner"],
+            birthday__between=(pd.Timestamp("1950-01-01"), None),
+        )
+        self.assertEqual(
+            [person.first_name for person in query.people], ["vorname1", "vorname4"]
+        )
+        self.assertEqual(len(query.where(email=None)), 1)
+        self.assertEqual(len(query.where(email__ne=None)), 1)
+        self.assertEqual(len(db.query().where(first_name__in=["vorname2"])), 1)
+        self.assertEqual(len(db.query()), 4)
+
+        db.load_riegen("tests/data/test_riegenlist.csv")
+        self.assertEqual(
+            [
+                person.first_name
+                for person in db.query().where(
+                    riegen_member__contains="Aktive U30 Herren",
+                    birthday__lt=pd.Timestamp("1950-01-01"),
+                )
+            ],
+            ["vorname3"],
+        )
+
+        # the query is evaluated again after the database changed
+        db.add_people([Person(first_name="vorname5", birthday="1999-06-06")])
+        self.assertEqual(len(query.people), 2)
+        self.assertEqual(len(db.query()), 5)
+
+        with self.assertRaises(ValueError):
+            db.query().where(birthday__after=pd.Timestamp("1950-01-01"))
+        with self.assertRaises(ValueError):
+            db.query().where(category__in="Aktive Turner")
+        with self.assertRaises(ValueError):
+            db.query().where(member_number__in=123)
+
+    def test_columnar_database(self):
+        file = "tests/data/test_database.xlsx"
+        db = Database(file)
+        columnar_db = ColumnarDatabase(file)
+        for property, search_input, comparator in [
+            ("first_name", "vorname1", None),
+            ("birthday", pd.Timestamp("1999-01-01"), np.greater),
+            ("birthday", pd.Timestamp("1999-01-01"), np.less_equal),
+            ("email", None, None),
+            ("category", "Aktive Turner", None),
+        ]:
+            self.assertEqual(
+                [
+                    person.member_number
+                    for person in db.lookup_by_property(
+                        property, search_input, comparator
+                    )
+                ],
+                [
+                    person.member_number
+                    for person in columnar_db.lookup_by_property(
+                        property, search_input, comparator
+                    )
+                ],
+            )
+        self.assertEqual(
+            len(columnar_db.lookup_by_values("category", ["Kitu (Kinder)", "x"])), 1
+        )
+        columnar_db.load_riegen("tests/data/test_riegenlist.csv")
+        for property, values in [
+            ("first_name", ["vorname1", "vorname3"]),
+            ("email", ["email3"]),
+            ("emails", ["email2", "email3"]),
+            ("riegen_member", [["Kitu"]]),
+            ("phone_p", [None]),
+        ]:
+            self.assertEqual(
+                columnar_db.lookup_by_values(property, values),
+                Database.lookup_by_values(columnar_db, property, values),
+            )
+        ages = columnar_db.table.ages(pd.Timestamp("2023-01-01"))
+        self.assertEqual(list(ages), [24, 22, 122, 67])
+
+    def test_load_riegen(self):
+        file = "tests/data/test_database.xlsx"
+        db = Database(file)
+        db.load_riegen("tests/data/test_riegenlist.csv")
+        self.assertEqual(db.riegen, ["Aktive U30 Herren", "Kitu"])
+
+        person = db.lookup_by_property("member_number", 123)[0]
+        self.assertEqual(person.riegen_member, ["Aktive U30 Herren"])
+        self.assertEqual(
+            person.riegen_coach, ["Unihockey Herren 1", "Unihockey Herren 2"]
+        )
+        kitu_person = db.lookup_by_property("member_number", 456)[0]
+        self.assertEqual(kitu_person.riegen_member, ["Kitu"])
+
+    def test_find_missing_values_of_property_in_referencelist(self):
+        file = "tests/data/test_database.xlsx"
+        db = Database(file)
+        backup_db = Database(file)
+        db.remove_property_for_people_matching_removelist(
+            property="email",
+            removelist=[Person(first_name="vorname2", last_name="nachname2")],
+        )
+        db.add_tag_to_all("BaseMember")
+
+        recovered = db.find_missing_values_of_property_in_referencelist(
+            property="email",
+            referencelist=backup_db.people,
+            exclusion_list=["category", "tags", "riegen_coach", "riegen_member"],
+        )
+        self.assertEqual(
+            [(person.first_name, email) for person, email in recovered],
+            [("vorname2", "email3")],
+        )
+        self.assertEqual(len(db.lookup_by_property("email", None)), 2)
+
+        db.copy_value_of_property_from_referencelist_if_empty_and_all_other_properties_match_except_exclusion_list(
+            property="email",
+            referencelist=backup_db.people,
+            exclusion_list=["category", "tags", "riegen_coach", "riegen_member"],
+        )
+        self.assertEqual(len(db.lookup_by_property("email", None)), 1)
+
+    def test_remove_values_for_property_from_people(self):
+        file = "tests/data/test_database.xlsx"
+        db = Database(file)
+        people_changed = db.remove_values_for_property_from_people(
+            {"email1", "email3", "unknown"}, property="email"
+        )
+        self.assertEqual(len(people_changed), 3)
+        self.assertEqual(len(db.lookup_by_property("email", None)), 4)
+
+        db = Database(file)
+        people_changed = db.remove_values_for_property_from_people(
+            {"email2"}, property="emails"
+        )
+        self.assertEqual([person.emails for person in people_changed], [["email1"]])
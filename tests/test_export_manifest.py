@@ -0,0 +1,109 @@
+import os
+import tempfile
+import pandas as pd
+from unittest import TestCase
+from src.utils.export_manifest import ExportManifest
+from src.utils.export_pool import ExportJob, build_and_write_df, run_export_jobs
+from src.utils.writers import write_df
+
+
+def build_df(first_names: list[str]) -> pd.DataFrame:
+    return pd.DataFrame({"Vorname": first_names})
+
+
+class TestExportManifest(TestCase):
+    def get_job(self, folder: str, df: pd.DataFrame, filename: str) -> ExportJob:
+        filename = os.path.join(folder, filename)
+        return ExportJob(
+            name="list",
+            filename=filename,
+            function=write_df,
+            args=(df, filename, "csv"),
+            content_hash=ExportManifest.get_content_hash(df, "csv"),
+        )
+
+    def test_run_export_jobs_with_manifest(self):
+        df = pd.DataFrame({"Vorname": ["vorname1", "vorname2"]})
+        with tempfile.TemporaryDirectory() as folder:
+            results = run_export_jobs(
+                [self.get_job(folder, df, "list_1.csv")],
+                manifest=ExportManifest(folder),
+            )
+            self.assertTrue(results[0].changed)
+
+            # same content under a new name only renames the file
+            results = run_export_jobs(
+                [self.get_job(folder, df, "list_2.csv")],
+                manifest=ExportManifest(folder),
+            )
+            self.assertFalse(results[0].changed)
+            self.assertFalse(os.path.isfile(os.path.join(folder, "list_1.csv")))
+            self.assertTrue(os.path.isfile(os.path.join(folder, "list_2.csv")))
+
+            df.loc[1, "Vorname"] = "vorname3"
+            results = run_export_jobs(
+                [self.get_job(folder, df, "list_2.csv")],
+                manifest=ExportManifest(folder),
+            )
+            self.assertTrue(results[0].changed)
+            self.assertEqual(
+                list(pd.read_csv(os.path.join(folder, "list_2.csv"))["Vorname"]),
+                ["vorname1", "vorname3"],
+            )
+
+    def test_missing_file_is_written_again(self):
+        df = pd.DataFrame({"Vorname": ["vorname1"]})
+        with tempfile.TemporaryDirectory() as folder:
+            run_export_jobs(
+                [self.get_job(folder, df, "list.csv")], manifest=ExportManifest(folder)
+            )
+            os.remove(os.path.join(folder, "list.csv"))
+            results = run_export_jobs(
+                [self.get_job(folder, df, "list.csv")], manifest=ExportManifest(folder)
+            )
+            self.assertTrue(results[0].changed)
+            self.assertTrue(os.path.isfile(os.path.join(folder, "list.csv")))
+
+    def test_build_and_write_df_in_worker(self):
+        def get_job(folder: str, filename: str, first_names: list[str]) -> ExportJob:
+            filename = os.path.join(folder, filename)
+            return ExportJob(
+                name="list",
+                filename=filename,
+                function=build_and_write_df,
+                args=(
+                    "list",
+                    filename,
+                    build_df,
+                    (first_names,),
+                    "csv",
+                    False,
+                    ExportManifest(folder),
+                ),
+            )
+
+        with tempfile.TemporaryDirectory() as folder:
+            for filename, first_names, changed in [
+                ("list_1.csv", ["vorname1"], True),
+                ("list_2.csv", ["vorname1"], False),
+                ("list_2.csv", ["vorname2"], True),
+            ]:
+                with self.assertLogs("src.utils.export_pool", "INFO") as logs:
+                    results = run_export_jobs(
+                        [get_job(folder, filename, first_names)],
+                        manifest=ExportManifest(folder),
+                    )
+                num_written = int(changed)
+                self.assertIn(
+                    f"Exported {num_written}/{num_written} changed files",
+                    logs.output[-1],
+                )
+                self.assertTrue(results[0].success)
+                self.assertEqual(results[0].changed, changed)
+            self.assertEqual(
+                sorted(os.listdir(folder)), ["export_manifest.json", "list_2.csv"]
+            )
+            self.assertEqual(
+                list(pd.read_csv(os.path.join(folder, "list_2.csv"))["Vorname"]),
+                ["vorname2"],
+            )
@@ -0,0 +1,34 @@
+import os
+import tempfile
+from unittest import TestCase
+from src.utils.export_pool import ExportJob, run_export_jobs
+
+
+def write_file(filename: str, content: str):
+    if content is None:
+        raise ValueError("no content")
+    with open(filename, "w") as f:
+        f.write(content)
+
+
+class TestExportPool(TestCase):
+    def test_run_export_jobs(self):
+        with tempfile.TemporaryDirectory() as folder:
+            jobs = [
+                ExportJob(
+                    name=str(idx),
+                    filename=os.path.join(folder, f"{idx}.txt"),
+                    function=write_file,
+                    args=(os.path.join(folder, f"{idx}.txt"), content),
+                )
+                for idx, content in enumerate(["a", None, "c"])
+            ]
+            results = run_export_jobs(jobs, max_workers=2)
+            self.assertEqual([result.name for result in results], ["0", "1", "2"])
+            self.assertEqual(
+                [result.success for result in results], [True, False, True]
+            )
+            self.assertEqual(sorted(os.listdir(folder)), ["0.txt", "2.txt"])
+
+        with self.assertRaises(ValueError):
+            run_export_jobs(jobs, executor="fiber")
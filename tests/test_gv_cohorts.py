@@ -0,0 +1,41 @@
+import pandas as pd
+from unittest import TestCase
+from src.utils.databases import Database, PersonTable
+from src.utils.gv_cohorts import GVCohorts
+
+
+class TestGVCohorts(TestCase):
+    def setUp(self):
+        self.db = Database("tests/data/test_database.xlsx")
+        for position, date_added in enumerate(
+            ["2024-05-01", "2024-01-01", "2000-01-01", "2025-03-03"]
+        ):
+            self.db._set_property(position, "date_added", pd.Timestamp(date_added))
+        self.cohorts = GVCohorts(PersonTable(self.db.people))
+
+    def test_adults_joined(self):
+        self.assertEqual(sorted(self.cohorts.adults_by_join_year), [2000, 2024, 2025])
+        self.assertEqual(
+            [person.first_name for person in self.cohorts.adults_joined(begin=2024)],
+            ["vorname1", "vorname4"],
+        )
+        self.assertEqual(
+            [person.first_name for person in self.cohorts.adults_joined(2000, 2001)],
+            ["vorname3"],
+        )
+        self.assertEqual(self.cohorts.adults_joined(1990, 2000), [])
+
+    def test_youth_born(self):
+        self.assertEqual(
+            [person.first_name for person in self.cohorts.youth_born(2000, 2001)],
+            ["vorname2"],
+        )
+        self.assertEqual(self.cohorts.youth_born(1999, 2000), [])
+
+    def test_grouped_by_category(self):
+        self.db._set_property(0, "category", "Passivmitglied")
+        cohorts = GVCohorts(PersonTable(self.db.people))
+        self.assertEqual(
+            [person.first_name for person in cohorts.adults_joined(begin=2024)],
+            ["vorname4", "vorname1"],
+        )
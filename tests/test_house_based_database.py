@@ -0,0 +1,36 @@
+from unittest import TestCase
+from src.utils.databases import HouseBasedDatabase, HouseBasedFamily, Person
+
+
+class TestHouseBasedDatabase(TestCase):
+    def test_load_house_based_database_excel(self):
+        file = "tests/data/test_database.xlsx"
+
+        hb_db = HouseBasedDatabase(file)
+        self.assertEqual(len(hb_db.house_based_families), 4)
+
+        hb_db.add_house_based_family(
+            HouseBasedFamily(
+                [
+                    Person(
+                        last_name="nachname1",
+                        street="Strasse1",
+                        plz=5436,
+                        city="ort1",
+                    )
+                ]
+            )
+        )
+        self.assertEqual(len(hb_db.house_based_families), 4)
+        self.assertEqual(len(hb_db.house_based_families[0].people), 2)
+
+    def test_combine_housemates(self):
+        file = "tests/data/test_database.xlsx"
+
+        hb_db = HouseBasedDatabase(file)
+        hb_db.combine_housemates("tests/data/test_housemates.xlsx")
+        self.assertEqual(len(hb_db.house_based_families), 2)
+        self.assertEqual(
+            [person.member_number for person in hb_db.house_based_families[0].people],
+            [123, 456, 789],
+        )
@@ -24,3 +24,15 @@ class TestMailBasedDatabase(TestCase):
         self.assertTrue(len(mb_db.mail_based_families) == 3)
         self.assertTrue(len(mb_db.mail_based_families[1].people) == 3)
         self.assertTrue(len(mb_db.lookup_by_property("email", None)) == 1)
+
+    def test_families_by_email(self):
+        file = "tests/data/test_database.csv"
+
+        mb_db = MailBasedDatabase(file)
+        mb_db.add_person(Person(emails=[" Email1 "]))
+        self.assertEqual(
+            list(mb_db.families_by_email.keys()), ["email1", "email3", None]
+        )
+        self.assertEqual(len(mb_db.families_by_email["email1"].people), 2)
+        self.assertEqual(len(mb_db.lookup_by_property("email", "EMAIL3")), 1)
+        self.assertEqual(len(mb_db.lookup_by_property("email", "email4")), 0)
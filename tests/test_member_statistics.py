@@ -0,0 +1,35 @@
+import pandas as pd
+from unittest import TestCase
+from src.utils.databases import Database, PersonTable
+from src.utils.member_statistics import compute_statistics, get_age_bucket_labels
+
+
+class TestMemberStatistics(TestCase):
+    def setUp(self):
+        self.db = Database("tests/data/test_database.xlsx")
+        self.db.load_riegen("tests/data/test_riegenlist.csv")
+        self.db.add_tag_to_all("BaseMember")
+        self.ts = pd.Timestamp(year=2024, month=6, day=1)
+
+    def test_compute_statistics(self):
+        stats = compute_statistics(PersonTable(self.db.people), "BaseMember", self.ts)
+        self.assertEqual(stats.num_total, 4)
+        self.assertEqual(stats.num_of_erw + stats.num_of_kids, 4)
+        self.assertEqual(
+            stats.num_of_men + stats.num_of_women,
+            stats.num_of_erw,
+        )
+        self.assertEqual(sum(stats.per_category.values()), 4)
+        self.assertEqual(sum(stats.per_age_bucket.values()), 4)
+        self.assertEqual(list(stats.per_age_bucket.keys()), get_age_bucket_labels())
+        self.assertEqual(stats.per_riege["Aktive U30 Herren"], 2)
+        self.assertEqual(stats.per_riege["Unihockey Herren 1"], 1)
+        self.assertEqual(stats.per_riege["Kitu"], 1)
+        self.assertIn("**Total Number of Members:** 4", stats.to_markdown())
+
+    def test_compute_statistics_without_members(self):
+        stats = compute_statistics(PersonTable(self.db.people), "Unknown", self.ts)
+        self.assertEqual(stats.num_total, 0)
+        self.assertEqual(stats.max_age, 0)
+        self.assertEqual(stats.per_riege, {})
+        self.assertEqual(sum(stats.per_age_bucket.values()), 0)
@@ -13,3 +13,9 @@ class TestPerson(TestCase):
 
         self.assertEqual(age1, 26)
         self.assertEqual(age2, 27)
+
+    def test_compact_person(self):
+        person = Person(first_name="vorname1")
+        self.assertFalse(hasattr(person, "__dict__"))
+        with self.assertRaises(AttributeError):
+            person.nickname = "nick"
@@ -0,0 +1,36 @@
+from unittest import TestCase
+from src.utils.databases import Database
+from src.utils.riegen_matrix import get_incidence_matrix, get_overlap_matrix
+
+
+class TestRiegenMatrix(TestCase):
+    def setUp(self):
+        self.db = Database("tests/data/test_database.xlsx")
+        self.db.load_riegen("tests/data/test_riegenlist.csv")
+        self.riegen = ["Aktive U30 Herren", "Unihockey Herren 1", "Kitu"]
+
+    def test_incidence_matrix(self):
+        incidence = get_incidence_matrix(self.db.people, self.riegen, role="coaches")
+        self.assertEqual(incidence.shape, (len(self.db.people), 3))
+        self.assertEqual(list(incidence.sum(axis=0)), [0, 1, 0])
+
+        with self.assertRaises(ValueError):
+            get_incidence_matrix(self.db.people, self.riegen, role="guests")
+
+    def test_overlap_matrix(self):
+        matrix = get_overlap_matrix(self.db.people, self.riegen)
+        self.assertEqual(list(matrix.index), self.riegen)
+        self.assertEqual(matrix.loc["Aktive U30 Herren", "Aktive U30 Herren"], 2)
+        self.assertEqual(matrix.loc["Aktive U30 Herren", "Unihockey Herren 1"], 1)
+        self.assertEqual(matrix.loc["Kitu", "Aktive U30 Herren"], 0)
+
+        matrix = get_overlap_matrix(
+            self.db.people, self.riegen, role="coaches", comparison_role="members"
+        )
+        self.assertEqual(matrix.loc["Unihockey Herren 1", "Aktive U30 Herren"], 1)
+        self.assertEqual(matrix.loc["Aktive U30 Herren", "Unihockey Herren 1"], 0)
+
+        matrix = get_overlap_matrix(self.db.people, self.riegen, jaccard=True)
+        self.assertEqual(matrix.loc["Aktive U30 Herren", "Aktive U30 Herren"], 1)
+        self.assertEqual(matrix.loc["Aktive U30 Herren", "Unihockey Herren 1"], 0.5)
+        self.assertEqual(matrix.loc["Kitu", "Aktive U30 Herren"], 0)
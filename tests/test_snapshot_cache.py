@@ -0,0 +1,48 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+from src.utils.databases import Database
+from src.utils.snapshot_cache import SnapshotCache
+
+
+class TestSnapshotCache(TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.input_file = os.path.join(self.folder, "test_database.csv")
+        shutil.copy("tests/data/test_database.csv", self.input_file)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_get_or_create(self):
+        cache = SnapshotCache(os.path.join(self.folder, ".cache"))
+        calls = []
+
+        def create():
+            calls.append(1)
+            return Database(self.input_file)
+
+        db = cache.get_or_create("main_db", [self.input_file], create)
+        cached_db = cache.get_or_create("main_db", [self.input_file], create)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(cached_db.people), len(db.people))
+        self.assertEqual(len(cached_db.lookup_by_property("email", "email3")), 2)
+
+        with open(self.input_file, "a") as f:
+            f.write("\n999;Männlich;vorname5;nachname5;strasse5;1234;ort1;05.05.05;;;;")
+        changed_db = cache.get_or_create("main_db", [self.input_file], create)
+        self.assertEqual(len(calls), 2)
+        self.assertEqual(len(changed_db.people), 5)
+        self.assertEqual(len(os.listdir(os.path.join(self.folder, ".cache"))), 1)
+
+    def test_clear(self):
+        cache = SnapshotCache(os.path.join(self.folder, ".cache"))
+        cache.get_or_create("main_db", [self.input_file], lambda: 1)
+        cache.get_or_create("other", [self.input_file], lambda: 2)
+        cache.clear("main_db")
+        self.assertEqual(len(os.listdir(os.path.join(self.folder, ".cache"))), 1)
+        cache.clear()
+        self.assertEqual(os.listdir(os.path.join(self.folder, ".cache")), [])
+        # clearing a cache that was never written does nothing
+        SnapshotCache(os.path.join(self.folder, "missing")).clear()
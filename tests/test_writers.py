@@ -0,0 +1,55 @@
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+from unittest import TestCase
+from src.utils.writers import TableWriter, write_df
+
+
+class TestWriters(TestCase):
+    def setUp(self):
+        self.df = pd.DataFrame(
+            {
+                "Vorname": ["vorname1", "vorname2"],
+                "Nummer": [np.int64(1), np.nan],
+            }
+        )
+
+    def test_write_df_xlsx(self):
+        with tempfile.TemporaryDirectory() as folder:
+            filename = write_df(self.df, os.path.join(folder, "OUT", "list.xlsx"))
+            self.assertEqual(filename, os.path.join(folder, "OUT", "list.xlsx"))
+            df = pd.read_excel(filename)
+            self.assertEqual(list(df.columns), ["Vorname", "Nummer"])
+            self.assertEqual(list(df["Vorname"]), ["vorname1", "vorname2"])
+            self.assertEqual(df["Nummer"][0], 1)
+            self.assertTrue(pd.isna(df["Nummer"][1]))
+
+    def test_write_df_csv(self):
+        with tempfile.TemporaryDirectory() as folder:
+            filename = write_df(
+                self.df, os.path.join(folder, "list.xlsx"), writer="csv"
+            )
+            self.assertEqual(filename, os.path.join(folder, "list.csv"))
+            df = pd.read_csv(filename)
+            self.assertEqual(list(df["Vorname"]), ["vorname1", "vorname2"])
+
+            filename = write_df(
+                self.df.set_index("Vorname"),
+                os.path.join(folder, "matrix"),
+                writer="csv",
+                index=True,
+            )
+            self.assertEqual(filename, os.path.join(folder, "matrix.csv"))
+            df = pd.read_csv(filename)
+            self.assertEqual(list(df.columns), ["Vorname", "Nummer"])
+
+        with self.assertRaises(ValueError):
+            write_df(self.df, "list.xlsx", writer="pdf")
+
+    def test_writer_without_write(self):
+        class IncompleteWriter(TableWriter):
+            suffix = ".txt"
+
+        with self.assertRaises(TypeError):
+            IncompleteWriter()